@@ -4,7 +4,9 @@ Handles asynchronous task processing for extraction and summarization
 """
 
 import logging
+import random
 from celery import Celery
+from celery.signals import worker_init, worker_process_init
 from app.config import settings
 
 # Configure logging
@@ -14,6 +16,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Make psycopg2 cooperative on the gevent pool (celery -P gevent monkey-patches
+# the stdlib before this module is imported)
+try:
+    from gevent import monkey
+    if monkey.is_module_patched("socket"):
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+        logger.info("✓ psycopg2 patched for gevent worker pool")
+except ImportError:
+    pass
+
 # Create Celery application
 celery_app = Celery(
     "neuroscribe",
@@ -30,9 +43,13 @@ celery_app = Celery(
 
 # Configure Celery
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # msgpack: compact binary payloads for fact-heavy results (task results are
+    # dumped with model_dump(mode="json") so they hold only msgpack-native types);
+    # json stays accepted for messages queued by older clients
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
+    result_accept_content=["msgpack", "json"],
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
@@ -40,21 +57,97 @@ celery_app.conf.update(
     task_soft_time_limit=settings.task_soft_time_limit,
     worker_prefetch_multiplier=settings.worker_prefetch_multiplier,
     worker_max_tasks_per_child=1000,
+    worker_proc_alive_timeout=60,  # Child init preloads NER models
     task_acks_late=True,
     task_reject_on_worker_lost=True,
     result_expires=3600,
     task_always_eager=settings.celery_task_always_eager,
 )
 
-# Task routes (if needed in the future)
+def retry_countdown(retries: int) -> float:
+    """Retry delay in seconds: exponential backoff with full jitter, capped at 5 minutes"""
+    return random.uniform(0, min(300, 5 * 2 ** retries))
+
+
+# Task routes
+# CPU-bound NER extraction goes to the "cpu" queue (prefork worker); the
+# I/O-bound queues are served by a gevent worker
 celery_app.conf.task_routes = {
-    "app.tasks.extraction.*": {"queue": "extraction"},
+    "app.tasks.extraction.*": {"queue": "cpu"},
     "app.tasks.summarization.*": {"queue": "summarization"},
     "app.tasks.validation.*": {"queue": "validation"},
     "app.tasks.graph_sync.*": {"queue": "graph"},
     "app.tasks.embeddings.*": {"queue": "embeddings"},
 }
 
+
+
+# Worker process lifecycle
+@worker_init.connect
+def preload_embedding_model(**kwargs):
+    """Load the embedding model in the parent worker before the pool forks"""
+    if not settings.worker_preload_embedding_model:
+        return
+
+    # Forked children (including ones recycled by worker_max_tasks_per_child)
+    # inherit the model weights copy-on-write instead of loading their own
+    try:
+        from app.services.vector_search import get_vector_search_service
+        get_vector_search_service()
+        logger.info("✓ Embedding model preloaded in worker parent process")
+    except Exception as e:
+        logger.warning(f"Embedding model preload failed, children will load lazily: {e}")
+
+
+@worker_init.connect
+def init_graph_schema(**kwargs):
+    """Create Neo4j constraints/indexes once per worker so sync MERGEs are index-backed"""
+    if not settings.enable_graph_construction:
+        return
+
+    try:
+        from app.services.graph_schema import ensure_graph_schema
+        ensure_graph_schema()
+    except Exception as e:
+        logger.warning(f"Graph schema initialization failed: {e}")
+
+
+@worker_process_init.connect
+def reset_embedding_service_connections(**kwargs):
+    """Drop database connections inherited from the parent after fork"""
+    from app.services import vector_search
+
+    service = vector_search._vector_search_service
+    if service is not None and service.engine is not None:
+        service.engine.dispose(close=False)
+
+
+@worker_process_init.connect
+def preload_ner_models(**kwargs):
+    """Load spaCy/scispaCy NER models once per worker process"""
+    try:
+        from app.modules.extraction import ner_models
+        ner_models.load_models()
+    except Exception as e:
+        logger.warning(f"NER model preload failed, models will load on first extraction: {e}")
+
+
+@worker_process_init.connect
+def init_task_database_pool(**kwargs):
+    """Create the shared task engine once per worker process"""
+    from app.tasks._db import get_engine
+
+    # Discard any connections inherited from the parent, then warm the pool
+    engine = get_engine()
+    engine.dispose(close=False)
+    try:
+        with engine.connect():
+            pass
+        logger.info("✓ Task database pool initialized")
+    except Exception as e:
+        logger.warning(f"Task database pool warm-up failed: {e}")
+
+
 logger.info("Celery application configured successfully")
 logger.info(f"Broker: {settings.celery_broker_url}")
 logger.info(f"Backend: {settings.celery_result_backend}")
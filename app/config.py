@@ -50,6 +50,8 @@ class Settings(BaseSettings):
     neo4j_user: str = Field(default="neo4j")
     neo4j_password: str = Field(default="neo4j_password")
     neo4j_database: str = Field(default="neo4j")
+    neo4j_import_dir: str = Field(default="/var/lib/neo4j/import")  # Shared with the Neo4j server
+    graph_sync_csv_threshold: int = Field(default=10000, ge=0)  # Facts above which sync uses LOAD CSV (0 = never)
 
     # LLM Providers
     openai_api_key: Optional[str] = Field(default=None)
@@ -73,6 +75,7 @@ class Settings(BaseSettings):
     celery_task_always_eager: bool = Field(default=False)
     worker_concurrency: int = Field(default=4, ge=1, le=16)
     worker_prefetch_multiplier: int = Field(default=2, ge=1, le=10)
+    worker_preload_embedding_model: bool = Field(default=True)
     task_time_limit: int = Field(default=600, ge=60, le=1800)
     task_soft_time_limit: int = Field(default=540, ge=50, le=1700)
 
@@ -85,10 +88,14 @@ class Settings(BaseSettings):
 
     # Extraction
     extraction_timeout: int = Field(default=300, ge=60, le=600)
-    extraction_batch_size: int = Field(default=10, ge=1, le=100)
+    extraction_batch_size: int = Field(default=64, ge=1, le=256)
     extraction_min_confidence: float = Field(default=0.7, ge=0.0, le=1.0)
     extraction_use_ner: bool = Field(default=True)
     extraction_use_llm: bool = Field(default=True)
+    extraction_quantize_biobert: bool = Field(default=True)
+    extraction_pipeline_disable: str = Field(default="parser,lemmatizer,attribute_ruler")
+    extraction_lexicon_backend: str = Field(default="ahocorasick", pattern="^(ahocorasick|flashtext|regex)$")
+    extraction_device: str = Field(default="cpu", pattern="^(cpu|cuda)$")
 
     # Temporal Reasoning
     temporal_conflict_threshold: float = Field(default=0.8, ge=0.0, le=1.0)
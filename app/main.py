@@ -52,6 +52,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to load NER models: {e}")
 
+    # Ensure graph constraints/indexes exist (fact sync MERGEs on node id)
+    try:
+        from app.services.neo4j_service import neo4j_service
+        neo4j_service.initialize_graph_schema()
+    except Exception as e:
+        logger.error(f"Failed to initialize graph schema: {e}")
+
     yield
 
     # Shutdown
@@ -7,10 +7,11 @@ from datetime import datetime
 from typing import List, Optional
 from sqlalchemy import (
     Boolean, DateTime, Float, ForeignKey, Integer, String, Text,
-    Enum, Index, CheckConstraint, UniqueConstraint, JSON
+    Enum, Index, CheckConstraint, UniqueConstraint, JSON, Computed, DDL, event
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, false
 from pgvector.sqlalchemy import Vector
 
 
@@ -66,6 +67,9 @@ class Patient(Base, TimestampMixin):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     last_visit_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
+    # Profile vector (average of all chunk embeddings, maintained by trigger)
+    profile_embedding: Mapped[Optional[Vector]] = mapped_column(Vector(384))
+
     # Relationships
     documents: Mapped[List["Document"]] = relationship(
         "Document",
@@ -91,6 +95,12 @@ class Patient(Base, TimestampMixin):
         CheckConstraint("age >= 0 AND age <= 150", name="valid_age"),
         Index("idx_patient_name", "last_name", "first_name"),
         Index("idx_patient_active", "is_active"),
+        Index(
+            "idx_patient_profile_embedding",
+            "profile_embedding",
+            postgresql_using="hnsw",
+            postgresql_ops={"profile_embedding": "vector_cosine_ops"}
+        ),
     )
 
     def __repr__(self) -> str:
@@ -157,6 +167,9 @@ class Document(Base, TimestampMixin):
     version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
     is_latest: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
+    # Profile vector (average of chunk embeddings, maintained by trigger)
+    profile_embedding: Mapped[Optional[Vector]] = mapped_column(Vector(384))
+
     # Relationships
     patient: Mapped["Patient"] = relationship("Patient", back_populates="documents")
     chunks: Mapped[List["DocumentChunk"]] = relationship(
@@ -183,6 +196,12 @@ class Document(Base, TimestampMixin):
         Index("idx_document_patient_date", "patient_id", "document_date"),
         Index("idx_document_status", "processing_status"),
         Index("idx_document_type_date", "document_type", "document_date"),
+        Index(
+            "idx_document_profile_embedding",
+            "profile_embedding",
+            postgresql_using="hnsw",
+            postgresql_ops={"profile_embedding": "vector_cosine_ops"}
+        ),
         CheckConstraint("version >= 1", name="positive_version"),
         CheckConstraint("facts_extracted >= 0", name="non_negative_facts"),
     )
@@ -215,13 +234,19 @@ class DocumentChunk(Base, TimestampMixin):
     # Vector embedding (384 dimensions for all-MiniLM-L6-v2)
     embedding: Mapped[Optional[Vector]] = mapped_column(Vector(384))
 
+    # Full-text search vector (maintained by Postgres for hybrid search)
+    content_tsv: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', chunk_text)", persisted=True)
+    )
+
     # Section classification
     section_name: Mapped[Optional[str]] = mapped_column(String(100))
     section_type: Mapped[Optional[str]] = mapped_column(String(50))
 
     # Metadata
     token_count: Mapped[Optional[int]] = mapped_column(Integer)
-    contains_clinical_entities: Mapped[bool] = mapped_column(Boolean, default=False)
+    contains_clinical_entities: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
 
     # Relationships
     document: Mapped["Document"] = relationship("Document", back_populates="chunks")
@@ -236,6 +261,7 @@ class DocumentChunk(Base, TimestampMixin):
             postgresql_with={"lists": 100},
             postgresql_ops={"embedding": "vector_cosine_ops"}
         ),
+        Index("idx_chunk_content_tsv", "content_tsv", postgresql_using="gin"),
         UniqueConstraint("document_id", "chunk_index", name="uq_document_chunk"),
         CheckConstraint("char_start >= 0", name="non_negative_char_start"),
         CheckConstraint("char_end > char_start", name="valid_char_range"),
@@ -245,6 +271,60 @@ class DocumentChunk(Base, TimestampMixin):
         return f"<DocumentChunk(id={self.id}, document_id={self.document_id}, index={self.chunk_index})>"
 
 
+# Keep documents.profile_embedding and patients.profile_embedding in sync with
+# their chunk embeddings. Statement-level triggers with transition tables
+# recompute each affected profile once per statement, not once per chunk row.
+_refresh_profile_embeddings = DDL("""
+CREATE OR REPLACE FUNCTION refresh_profile_embeddings() RETURNS trigger AS $$
+BEGIN
+    UPDATE documents d
+    SET profile_embedding = (
+        SELECT AVG(dc.embedding)
+        FROM document_chunks dc
+        WHERE dc.document_id = d.id AND dc.embedding IS NOT NULL
+    )
+    WHERE d.id IN (SELECT DISTINCT document_id FROM changed_chunks);
+
+    UPDATE patients p
+    SET profile_embedding = (
+        SELECT AVG(dc.embedding)
+        FROM document_chunks dc
+        JOIN documents d ON dc.document_id = d.id
+        WHERE d.patient_id = p.id AND dc.embedding IS NOT NULL
+    )
+    WHERE p.id IN (
+        SELECT DISTINCT d.patient_id
+        FROM documents d
+        WHERE d.id IN (SELECT document_id FROM changed_chunks)
+    );
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_chunk_profile_insert
+    AFTER INSERT ON document_chunks
+    REFERENCING NEW TABLE AS changed_chunks
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_profile_embeddings();
+
+CREATE TRIGGER trg_chunk_profile_update
+    AFTER UPDATE ON document_chunks
+    REFERENCING NEW TABLE AS changed_chunks
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_profile_embeddings();
+
+CREATE TRIGGER trg_chunk_profile_delete
+    AFTER DELETE ON document_chunks
+    REFERENCING OLD TABLE AS changed_chunks
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_profile_embeddings();
+""")
+
+event.listen(
+    DocumentChunk.__table__,
+    "after_create",
+    _refresh_profile_embeddings.execute_if(dialect="postgresql")
+)
+
+
 # =============================================================================
 # Clinical Fact Models
 # =============================================================================
@@ -3,15 +3,20 @@ NeuroscribeAI Extraction Engine
 Hybrid NER + LLM + Rule-based extraction for 95%+ recall
 """
 
+from __future__ import annotations
+
 import re
+import sys
+import bisect
 import logging
 import json
-from typing import List, Dict, Optional, Tuple, Any
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple, Any
 from datetime import datetime
-import spacy
-from spacy.tokens import Doc, Span
-import scispacy
-from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.schemas import (
@@ -22,6 +27,43 @@ from app.schemas import (
 )
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+# spaCy/scispaCy and transformers are imported when models load, so the
+# rule-based extractors can be imported without paying for them
+if TYPE_CHECKING:
+    import spacy
+    from spacy.tokens import Doc, Span
+
+# Linear-time (DFA) regex engine for the lexicon alternations; re is a drop-in
+# fallback since all re2 patterns below use inline flags only
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = re
+    RE2_AVAILABLE = False
+
+# Aho-Corasick automaton for lexicon lookups (one pass over the text for all terms)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from flashtext import KeywordProcessor
+    FLASHTEXT_AVAILABLE = True
+except ImportError:
+    FLASHTEXT_AVAILABLE = False
+
+# SIMD multi-pattern scanner for the dose pattern (one pass per document)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
 # Conditional imports for LLM providers
 try:
     import openai
@@ -37,8 +79,6 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
     logger.warning("Anthropic library not available")
 
-logger = logging.getLogger(__name__)
-
 
 # =============================================================================
 # LLM Extraction Client
@@ -230,7 +270,10 @@ JSON Array:"""
                             source_snippet=snippet,
                             confidence_score=0.92,  # LLM confidence
                             extraction_method="llm",
-                            anatomical_context=item.get('anatomical_context'),
+                            anatomical_context=(
+                                AnatomicalContext.model_validate(item['anatomical_context']).dict()
+                                if item.get('anatomical_context') else None
+                            ),
                             is_negated=item.get('is_negated', False),
                             is_historical=item.get('is_historical', False),
                             char_start=char_start if char_start != -1 else None,
@@ -253,6 +296,35 @@ JSON Array:"""
 # NER Models Loading
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def load_spacy_model(name: str, disable: Tuple[str, ...] = ()) -> spacy.Language:
+    """
+    Load a spaCy/scispaCy pipeline once per process
+
+    Args:
+        name: Installed model package name
+        disable: Pipeline components to switch off (names the model lacks are ignored)
+
+    Returns:
+        Loaded pipeline
+    """
+    import spacy
+    import scispacy  # noqa: F401 - registers scispaCy pipeline components
+
+    nlp = spacy.load(name)
+    for component in disable:
+        if component in nlp.pipe_names:
+            nlp.disable_pipe(component)
+    return nlp
+
+
+# Components the extractors never read (only doc.ents is used);
+# tok2vec/tagger/ner stay enabled
+SPACY_DISABLED_COMPONENTS = tuple(
+    name.strip() for name in settings.extraction_pipeline_disable.split(",") if name.strip()
+)
+
+
 class NERModels:
     """Container for NER models"""
 
@@ -260,6 +332,7 @@ class NERModels:
         self.spacy_model: Optional[spacy.Language] = None
         self.scispacy_model: Optional[spacy.Language] = None
         self.biobert_ner: Optional[Any] = None
+        self.device = "cpu"
         self.loaded = False
         self.load_errors: List[str] = []
 
@@ -275,11 +348,14 @@ class NERModels:
         models_loaded = 0
         total_models = 2 + (1 if settings.extraction_use_llm else 0)
 
+        # Must run before any spaCy model is loaded
+        self._select_device()
+
         try:
             # Load spaCy general model
             logger.info("Loading spaCy en_core_web_sm model...")
             try:
-                self.spacy_model = spacy.load("en_core_web_sm")
+                self.spacy_model = load_spacy_model("en_core_web_sm", SPACY_DISABLED_COMPONENTS)
                 logger.info("✓ spaCy en_core_web_sm loaded successfully")
                 models_loaded += 1
             except OSError as e:
@@ -293,7 +369,7 @@ class NERModels:
             # Load scispaCy medical model
             logger.info("Loading scispaCy en_ner_bc5cdr_md model...")
             try:
-                self.scispacy_model = spacy.load("en_ner_bc5cdr_md")
+                self.scispacy_model = load_spacy_model("en_ner_bc5cdr_md", SPACY_DISABLED_COMPONENTS)
                 logger.info("✓ scispaCy en_ner_bc5cdr_md loaded successfully")
                 models_loaded += 1
             except OSError as e:
@@ -309,11 +385,17 @@ class NERModels:
             if settings.extraction_use_llm:
                 logger.info("Loading BioBERT NER model (this may take a while on first run)...")
                 try:
+                    from transformers import pipeline
+
                     self.biobert_ner = pipeline(
                         "ner",
                         model="dmis-lab/biobert-base-cased-v1.2",
-                        aggregation_strategy="simple"
+                        aggregation_strategy="simple",
+                        device=0 if self.device == "cuda" else -1
                     )
+                    # Dynamic int8 quantization is CPU-only
+                    if settings.extraction_quantize_biobert and self.device == "cpu":
+                        self._quantize_biobert()
                     logger.info("✓ BioBERT NER loaded successfully")
                     models_loaded += 1
                 except Exception as e:
@@ -345,10 +427,35 @@ class NERModels:
                 logger.error("  See logs above for details")
                 raise
 
+    def _select_device(self):
+        """Run spaCy (and BioBERT) on the GPU when EXTRACTION_DEVICE=cuda, else CPU"""
+        if settings.extraction_device != "cuda":
+            return
+
+        try:
+            import spacy
+            spacy.require_gpu()
+            self.device = "cuda"
+            logger.info("✓ NER models will run on GPU")
+        except Exception as e:
+            logger.warning(f"⚠ GPU requested but unavailable, running NER on CPU: {e}")
+
+    def _quantize_biobert(self):
+        """Swap BioBERT Linear layers for int8 dynamically quantized ones (CPU inference)"""
+        try:
+            import torch
+            self.biobert_ner.model = torch.ao.quantization.quantize_dynamic(
+                self.biobert_ner.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            logger.info("✓ BioBERT quantized to int8")
+        except Exception as e:
+            logger.warning(f"⚠ BioBERT quantization failed, using FP32 model: {e}")
+
     def get_status(self) -> Dict[str, Any]:
         """Get status of loaded models"""
         return {
             "loaded": self.loaded,
+            "device": self.device,
             "models": {
                 "spacy_general": self.spacy_model is not None,
                 "scispacy_medical": self.scispacy_model is not None,
@@ -361,6 +468,61 @@ class NERModels:
 # Global NER models instance
 ner_models = NERModels()
 
+# Documents per nlp.pipe() batch in batched extraction (EXTRACTION_BATCH_SIZE)
+NER_PIPE_BATCH_SIZE = settings.extraction_batch_size
+
+class ExtractionResultCache:
+    """In-process LRU cache of extraction results keyed by a hash of the text"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[bytes, List[AtomicClinicalFact]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text: str, context: Tuple[Any, ...] = ()) -> bytes:
+        """128-bit BLAKE2b digest of the text and the extraction context that shaped its facts"""
+        digest = hashlib.blake2b(repr(context).encode("utf-8"), digest_size=16)
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[List[AtomicClinicalFact]]:
+        """Return deep copies of the cached facts (callers may mutate them and their detail dicts), or None"""
+        with self._lock:
+            facts = self._entries.get(key)
+            if facts is None:
+                return None
+            self._entries.move_to_end(key)
+        return [fact.model_copy(deep=True) for fact in facts]
+
+    def put(self, key: bytes, facts: List[AtomicClinicalFact]):
+        """Store deep copies of facts, evicting the least recently used entry when full"""
+        facts = [fact.model_copy(deep=True) for fact in facts]
+        with self._lock:
+            self._entries[key] = facts
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Re-ingesting an unchanged note returns the cached facts (facts carry no
+# patient/document ids, so they depend on the text and extraction context alone)
+extraction_result_cache = ExtractionResultCache(settings.cache_max_size)
+
+# Background threads for LLM extraction requests, so the network round-trip
+# overlaps local NER/rule-based extraction (threads start on first use, after fork)
+LLM_EXTRACTION_MAX_WORKERS = 4
+llm_extraction_executor = ThreadPoolExecutor(
+    max_workers=LLM_EXTRACTION_MAX_WORKERS,
+    thread_name_prefix="llm-extraction"
+)
+
 
 # =============================================================================
 # Regular Expression Patterns
@@ -393,9 +555,8 @@ class ClinicalPatterns:
     )
 
     # Glasgow Coma Scale
-    GCS_PATTERN = re.compile(
-        r'\bGCS\s*(?:of\s*)?(\d{1,2})(?:\s*\(E\s*(\d)\s*V\s*(\d)\s*M\s*(\d)\))?',
-        re.IGNORECASE
+    GCS_PATTERN = re2.compile(
+        r'(?i)\bGCS\s*(?:of\s*)?(\d{1,2})(?:\s*\(E\s*(\d)\s*V\s*(\d)\s*M\s*(\d)\))?'
     )
 
     # Medication dosing
@@ -404,6 +565,12 @@ class ClinicalPatterns:
         re.IGNORECASE
     )
 
+    # Dose immediately following a medication name (e.g., "levetiracetam 500mg")
+    MEDICATION_DOSE_TAIL = re.compile(
+        r'\s*(\d+(?:\.\d+)?)\s*(mg|g|mcg|μg|units?|mL|L|%)\b',
+        re.IGNORECASE
+    )
+
     # Medication frequency
     MEDICATION_FREQ = re.compile(
         r'\b(qd|bid|tid|qid|q\d+h|daily|twice daily|three times daily|'
@@ -411,9 +578,12 @@ class ClinicalPatterns:
         re.IGNORECASE
     )
 
+    # Possessive quantifiers (*+, ++) below never backtrack, so the lab and
+    # temporal scans stay linear on long notes without a match
+
     # Lab values
     LAB_VALUE = re.compile(
-        r'\b([A-Z][A-Za-z0-9\s-]+?):\s*(\d+(?:\.\d+)?)\s*([A-Za-z/]+)?',
+        r'\b([A-Z][A-Za-z0-9\s-]++):\s*+(\d++(?:\.\d++)?)\s*+([A-Za-z/]++)?',
         re.MULTILINE
     )
 
@@ -425,12 +595,12 @@ class ClinicalPatterns:
 
     # Temporal expressions
     POST_OP_DAY = re.compile(
-        r'\b(?:POD|post-?op(?:erative)?\s+day)\s*#?\s*(\d+)\b',
+        r'\b(?:POD|post-?op(?:erative)?\s++day)\s*+#?\s*+(\d++)\b',
         re.IGNORECASE
     )
 
     HOSPITAL_DAY = re.compile(
-        r'\b(?:HD|hospital\s+day)\s*#?\s*(\d+)\b',
+        r'\b(?:HD|hospital\s++day)\s*+#?\s*+(\d++)\b',
         re.IGNORECASE
     )
 
@@ -446,6 +616,13 @@ class ClinicalPatterns:
 # Entity Extractors
 # =============================================================================
 
+# Extractors build facts with model_construct: fields come from controlled
+# pattern captures, so per-fact validation is skipped. Detail fields are the
+# validated detail models dumped to dicts, as the schema types them. Entity names taken from
+# the text are interned, so repeated mentions share one string object.
+# Medication and procedure entity_name values are the canonical lowercase
+# lexicon names; the matched surface form is kept in extracted_text.
+
 class DiagnosisExtractor:
     """Extract diagnoses and pathologies"""
 
@@ -460,9 +637,9 @@ class DiagnosisExtractor:
                 # Get anatomical context
                 anatomical_context = AnatomicalContextExtractor.extract_for_span(ent)
 
-                fact = AtomicClinicalFact(
+                fact = AtomicClinicalFact.model_construct(
                     entity_type=EntityType.DIAGNOSIS,
-                    entity_name=ent.text,
+                    entity_name=sys.intern(ent.text),
                     extracted_text=ent.text,
                     source_snippet=text[max(0, ent.start_char-50):min(len(text), ent.end_char+50)],
                     confidence_score=0.85,
@@ -487,64 +664,130 @@ class ProcedureExtractor:
         "clipping", "coiling", "stereotactic biopsy", "radiosurgery"
     ]
 
+    # One pass over the text for every procedure (longest name first), with
+    # an optional directly preceding laterality/region ("left frontal craniotomy")
+    PROCEDURE_PATTERN = re.compile(
+        r'(?:\b(?P<lat>left|right|bilateral)\s+)?'
+        r'(?:\b(?P<region>frontal|parietal|temporal|occipital)\s+)?'
+        r'\b(?P<proc>' + '|'.join(sorted(PROCEDURES, key=len, reverse=True)) + r')\b',
+        re.IGNORECASE
+    )
+
     @staticmethod
     def extract(text: str) -> List[AtomicClinicalFact]:
         """Extract procedures from text"""
         facts = []
 
-        for procedure in ProcedureExtractor.PROCEDURES:
-            pattern = re.compile(rf'\b{procedure}\b', re.IGNORECASE)
-            for match in pattern.finditer(text):
-                # Get context
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
-                context = text[start:end]
+        for match in ProcedureExtractor.PROCEDURE_PATTERN.finditer(text):
+            # Canonical lowercase name; the surface form stays in extracted_text
+            procedure = sys.intern(match.group("proc").lower())
+            proc_start, proc_end = match.span("proc")
 
-                # Extract anatomical context
-                laterality = None
+            # Get context
+            start = max(0, proc_start - 100)
+            end = min(len(text), proc_end + 100)
+            context = text[start:end]
+
+            # Extract anatomical context: prefix captured with the procedure,
+            # otherwise the nearest mention in the surrounding context
+            laterality = None
+            lat_text = match.group("lat")
+            if not lat_text:
                 lat_match = ClinicalPatterns.LATERALITY.search(context)
-                if lat_match:
-                    laterality = Laterality(lat_match.group(1).lower())
+                lat_text = lat_match.group(1) if lat_match else None
+            if lat_text:
+                try:
+                    laterality = Laterality(lat_text.lower())
+                except ValueError:
+                    pass
 
-                brain_region = None
+            brain_region = None
+            region_text = match.group("region")
+            if not region_text:
                 region_match = ClinicalPatterns.BRAIN_REGION.search(context)
-                if region_match:
-                    try:
-                        brain_region = BrainRegion(region_match.group(1).lower())
-                    except ValueError:
-                        pass
-
-                anatomical_context = None
-                if laterality or brain_region:
-                    anatomical_context = AnatomicalContext(
-                        laterality=laterality,
-                        brain_region=brain_region
-                    )
+                region_text = region_match.group(1) if region_match else None
+            if region_text:
+                try:
+                    brain_region = BrainRegion(region_text.lower())
+                except ValueError:
+                    pass
 
-                procedure_detail = ProcedureDetail(
-                    procedure_name=match.group(0),
-                    procedure_type="surgical",
-                    approach=None,
-                    duration_minutes=None
+            anatomical_context = None
+            if laterality or brain_region:
+                anatomical_context = AnatomicalContext(
+                    laterality=laterality,
+                    brain_region=brain_region
                 )
 
-                fact = AtomicClinicalFact(
-                    entity_type=EntityType.PROCEDURE,
-                    entity_name=match.group(0),
-                    extracted_text=match.group(0),
-                    source_snippet=context,
-                    confidence_score=0.9,
-                    extraction_method="rule_based",
-                    anatomical_context=anatomical_context.dict() if anatomical_context else None,
-                    procedure_detail=procedure_detail.dict(),
-                    char_start=match.start(),
-                    char_end=match.end()
-                )
-                facts.append(fact)
+            procedure_detail = ProcedureDetail(
+                procedure_name=procedure,
+                procedure_type="surgical",
+                approach=None,
+                duration_minutes=None
+            )
+
+            fact = AtomicClinicalFact.model_construct(
+                entity_type=EntityType.PROCEDURE,
+                entity_name=procedure,
+                extracted_text=match.group("proc"),
+                source_snippet=context,
+                confidence_score=0.9,
+                extraction_method="rule_based",
+                anatomical_context=anatomical_context.dict() if anatomical_context else None,
+                procedure_detail=procedure_detail.dict(),
+                char_start=proc_start,
+                char_end=proc_end
+            )
+            facts.append(fact)
 
         return facts
 
 
+def _build_lexicon_automaton(terms) -> Optional[Any]:
+    """Build an Aho-Corasick automaton over lowercase lexicon terms (None if unavailable)"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term.lower(), term)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_keyword_processor(terms) -> Optional[Any]:
+    """Build a case-insensitive flashtext trie over lexicon terms (None if unavailable)"""
+    if not FLASHTEXT_AVAILABLE:
+        return None
+
+    processor = KeywordProcessor(case_sensitive=False)
+    for term in terms:
+        processor.add_keyword(term, term)
+    return processor
+
+
+def _build_dose_database() -> Optional[Any]:
+    """Compile the dose pattern into a Hyperscan database (None if unavailable)"""
+    if not HYPERSCAN_AVAILABLE:
+        return None
+
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[rb'\d+(?:\.\d+)?\s*(?:mg|g|mcg|units?|mL|L|%)\b'],
+        ids=[0],
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST]
+    )
+    return database
+
+
+def _is_word_boundary(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] is a whole word, not part of a larger one"""
+    return (
+        (start == 0 or not (text[start - 1].isalnum() or text[start - 1] == "_")) and
+        (end == len(text) or not (text[end].isalnum() or text[end] == "_"))
+    )
+
+
 class MedicationExtractor:
     """Extract medications with dosing information"""
 
@@ -566,65 +809,182 @@ class MedicationExtractor:
         "clopidogrel": ("clopidogrel", "Plavix"),
     }
 
+    # Single alternation over the whole lexicon (longest name first), so the
+    # text is scanned once rather than once per drug
+    MEDICATION_NAME_PATTERN = re2.compile(
+        r'(?i)\b(?:'
+        + '|'.join(re2.escape(name) for name in sorted(MEDICATIONS, key=len, reverse=True))
+        + r')\b'
+    )
+
+    MEDICATION_AUTOMATON = _build_lexicon_automaton(MEDICATIONS)
+    MEDICATION_KEYWORDS = _build_keyword_processor(MEDICATIONS)
+    DOSE_DATABASE = _build_dose_database()
+
+    # Canonical spelling for the units MEDICATION_DOSE captures (keyed by the
+    # lowercased capture; IGNORECASE lets μg, U+03BC, also match the micro
+    # sign µ, U+00B5); all facts share these string objects
+    DOSE_UNITS = {
+        "mg": "mg",
+        "g": "g",
+        "mcg": "mcg",
+        "μg": "mcg",
+        "µg": "mcg",
+        "unit": "units",
+        "units": "units",
+        "ml": "mL",
+        "l": "L",
+        "%": "%",
+    }
+
+    @staticmethod
+    def _scan_doses(text: str) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find all dose spans in one Hyperscan pass
+
+        Returns:
+            Sorted (start, end) spans, or None when Hyperscan is unavailable or
+            the text is not ASCII (byte offsets would not match str offsets)
+        """
+        database = MedicationExtractor.DOSE_DATABASE
+        if database is None or not text.isascii():
+            return None
+
+        spans = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            spans.append((start, end))
+
+        database.scan(text.encode("ascii"), match_event_handler=on_match)
+        spans.sort()
+        return spans
+
+    @staticmethod
+    def _dose_near(
+        text: str,
+        doses: List[Tuple[int, int]],
+        match_end: int,
+        window_start: int,
+        window_end: int
+    ) -> Optional[re.Match]:
+        """Pick the dose right after a mention, else the first one in its context window"""
+        i = bisect.bisect_left(doses, (match_end, 0))
+        if i < len(doses) and not text[match_end:doses[i][0]].strip():
+            return ClinicalPatterns.MEDICATION_DOSE.match(text, doses[i][0])
+
+        i = bisect.bisect_left(doses, (window_start, 0))
+        if i < len(doses) and doses[i][1] <= window_end:
+            return ClinicalPatterns.MEDICATION_DOSE.match(text, doses[i][0])
+
+        return None
+
+    @staticmethod
+    def _find_mentions(text: str) -> List[Tuple[int, int, str]]:
+        """Find (start, end, lexicon key) for every medication mention in text order"""
+        backend = settings.extraction_lexicon_backend
+        automaton = MedicationExtractor.MEDICATION_AUTOMATON
+        keywords = MedicationExtractor.MEDICATION_KEYWORDS
+        lowered = text.lower()
+
+        # Offsets only line up when lowercasing preserves length
+        if len(lowered) != len(text):
+            backend = "regex"
+
+        if backend == "flashtext" and keywords is not None:
+            # Trie walk; whole-word, leftmost-longest, non-overlapping spans
+            return [
+                (start, end, name)
+                for name, start, end in keywords.extract_keywords(text, span_info=True)
+            ]
+
+        if backend != "ahocorasick" or automaton is None:
+            return [
+                (match.start(), match.end(), match.group(0).lower())
+                for match in MedicationExtractor.MEDICATION_NAME_PATTERN.finditer(text)
+            ]
+
+        hits = sorted(
+            ((end_idx - len(name) + 1, end_idx + 1, name) for end_idx, name in automaton.iter(lowered)),
+            key=lambda hit: (hit[0], -hit[1])
+        )
+
+        # Keep whole-word, non-overlapping hits, leftmost-longest like the regex
+        mentions = []
+        last_end = 0
+        for start, end, name in hits:
+            if start >= last_end and _is_word_boundary(lowered, start, end):
+                mentions.append((start, end, name))
+                last_end = end
+
+        return mentions
+
     @staticmethod
     def extract(text: str) -> List[AtomicClinicalFact]:
         """Extract medications from text"""
         facts = []
+        doses = MedicationExtractor._scan_doses(text)
 
-        for generic_name, (generic, brand) in MedicationExtractor.MEDICATIONS.items():
-            # Search for medication mentions
-            pattern = re.compile(rf'\b{generic_name}\b', re.IGNORECASE)
-            for match in pattern.finditer(text):
-                # Get context for dosing information
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 100)
-                context = text[start:end]
-
-                # Extract dose
-                dose_value = None
-                dose_unit = None
-                dose_match = ClinicalPatterns.MEDICATION_DOSE.search(context)
-                if dose_match:
-                    dose_value = float(dose_match.group(1))
-                    dose_unit = dose_match.group(2).lower()
-
-                # Extract frequency
-                frequency = None
-                freq_match = ClinicalPatterns.MEDICATION_FREQ.search(context)
-                if freq_match:
-                    freq_text = freq_match.group(1).lower()
-                    if freq_text in ["qd", "daily"]:
-                        frequency = MedicationFrequency.DAILY
-                    elif freq_text in ["bid", "twice daily"]:
-                        frequency = MedicationFrequency.BID
-                    elif freq_text in ["tid", "three times daily"]:
-                        frequency = MedicationFrequency.TID
-                    elif freq_text in ["qid"]:
-                        frequency = MedicationFrequency.QID
-                    elif freq_text in ["prn", "as needed"]:
-                        frequency = MedicationFrequency.PRN
-
-                medication_detail = MedicationDetail(
-                    generic_name=generic,
-                    brand_name=brand,
-                    dose_value=dose_value,
-                    dose_unit=dose_unit,
-                    frequency=frequency,
-                    as_needed=(frequency == MedicationFrequency.PRN)
-                )
+        for match_start, match_end, name in MedicationExtractor._find_mentions(text):
+            generic, brand = MedicationExtractor.MEDICATIONS[name]
 
-                fact = AtomicClinicalFact(
-                    entity_type=EntityType.MEDICATION,
-                    entity_name=generic,
-                    extracted_text=match.group(0),
-                    source_snippet=context,
-                    confidence_score=0.95,
-                    extraction_method="rule_based",
-                    medication_detail=medication_detail.dict(),
-                    char_start=match.start(),
-                    char_end=match.end()
+            # Get context for dosing information
+            start = max(0, match_start - 50)
+            end = min(len(text), match_end + 100)
+            context = text[start:end]
+
+            # Extract dose: prefer the dose right after the name, then the window
+            dose_value = None
+            dose_unit = None
+            if doses is not None:
+                dose_match = MedicationExtractor._dose_near(text, doses, match_end, start, end)
+            else:
+                dose_match = (
+                    ClinicalPatterns.MEDICATION_DOSE_TAIL.match(text, match_end) or
+                    ClinicalPatterns.MEDICATION_DOSE.search(context)
                 )
-                facts.append(fact)
+            if dose_match:
+                dose_value = float(dose_match.group(1))
+                unit = dose_match.group(2)
+                # Keep the raw capture for any spelling missing from the table
+                dose_unit = MedicationExtractor.DOSE_UNITS.get(unit.lower(), unit)
+
+            # Extract frequency
+            frequency = None
+            freq_match = ClinicalPatterns.MEDICATION_FREQ.search(context)
+            if freq_match:
+                freq_text = freq_match.group(1).lower()
+                if freq_text in ["qd", "daily"]:
+                    frequency = MedicationFrequency.DAILY
+                elif freq_text in ["bid", "twice daily"]:
+                    frequency = MedicationFrequency.BID
+                elif freq_text in ["tid", "three times daily"]:
+                    frequency = MedicationFrequency.TID
+                elif freq_text in ["qid"]:
+                    frequency = MedicationFrequency.QID
+                elif freq_text in ["prn", "as needed"]:
+                    frequency = MedicationFrequency.PRN
+
+            medication_detail = MedicationDetail(
+                generic_name=generic,
+                brand_name=brand,
+                dose_value=dose_value,
+                dose_unit=dose_unit,
+                frequency=frequency,
+                as_needed=(frequency == MedicationFrequency.PRN)
+            )
+
+            fact = AtomicClinicalFact.model_construct(
+                entity_type=EntityType.MEDICATION,
+                entity_name=generic,
+                extracted_text=text[match_start:match_end],
+                source_snippet=context,
+                confidence_score=0.95,
+                extraction_method="rule_based",
+                medication_detail=medication_detail.dict(),
+                char_start=match_start,
+                char_end=match_end
+            )
+            facts.append(fact)
 
         return facts
 
@@ -654,9 +1014,9 @@ class LabExtractor:
                 timestamp=None
             )
 
-            fact = AtomicClinicalFact(
+            fact = AtomicClinicalFact.model_construct(
                 entity_type=EntityType.LAB_VALUE,
-                entity_name=lab_name,
+                entity_name=sys.intern(lab_name),
                 extracted_text=match.group(0),
                 source_snippet=context,
                 confidence_score=0.9,
@@ -673,6 +1033,28 @@ class LabExtractor:
 class NeuroExamExtractor:
     """Extract neurological examination findings"""
 
+    # Common muscle groups
+    MUSCLES = {
+        "deltoid": ["right_deltoid", "left_deltoid"],
+        "biceps": ["right_biceps", "left_biceps"],
+        "triceps": ["right_triceps", "left_triceps"],
+        "wrist extensors": ["right_wrist_ext", "left_wrist_ext"],
+        "grip": ["right_grip", "left_grip"],
+        "iliopsoas": ["right_iliopsoas", "left_iliopsoas"],
+        "quadriceps": ["right_quadriceps", "left_quadriceps"],
+        "hamstrings": ["right_hamstrings", "left_hamstrings"],
+        "tibialis anterior": ["right_tibialis_ant", "left_tibialis_ant"],
+        "gastrocnemius": ["right_gastrocnemius", "left_gastrocnemius"]
+    }
+
+    # Compiled once at import, not per document
+    MOTOR_PATTERNS = {
+        muscle_name: re2.compile(
+            rf'(?i)\b(left|right|bilateral)?\s*{muscle_name}\s*[:\-]?\s*(\d[+-]?)/5'
+        )
+        for muscle_name in MUSCLES
+    }
+
     @staticmethod
     def extract_gcs(text: str) -> List[AtomicClinicalFact]:
         """Extract Glasgow Coma Scale scores"""
@@ -687,11 +1069,17 @@ class NeuroExamExtractor:
                 verbal = int(match.group(3))
                 motor = int(match.group(4))
 
-                gcs = GlasgowComaScale(
-                    eye_opening=eye,
-                    verbal_response=verbal,
-                    motor_response=motor
-                )
+                # Range-check here so an out-of-scale component (e.g. a typo
+                # like "E5") drops the breakdown instead of raising from
+                # pydantic validation; in-range values skip re-validation
+                if 1 <= eye <= 4 and 1 <= verbal <= 5 and 1 <= motor <= 6:
+                    gcs = GlasgowComaScale.model_construct(
+                        eye_opening=eye,
+                        verbal_response=verbal,
+                        motor_response=motor
+                    )
+                else:
+                    gcs = None
             else:
                 # If only total provided, we can't create a complete GCS object
                 gcs = None
@@ -704,7 +1092,7 @@ class NeuroExamExtractor:
                 motor_exam=None
             ) if gcs else None
 
-            fact = AtomicClinicalFact(
+            fact = AtomicClinicalFact.model_construct(
                 entity_type=EntityType.PHYSICAL_EXAM,
                 entity_name="Glasgow Coma Scale",
                 extracted_text=match.group(0),
@@ -724,25 +1112,8 @@ class NeuroExamExtractor:
         """Extract motor examination findings"""
         facts = []
 
-        # Common muscle groups
-        muscles = {
-            "deltoid": ["right_deltoid", "left_deltoid"],
-            "biceps": ["right_biceps", "left_biceps"],
-            "triceps": ["right_triceps", "left_triceps"],
-            "wrist extensors": ["right_wrist_ext", "left_wrist_ext"],
-            "grip": ["right_grip", "left_grip"],
-            "iliopsoas": ["right_iliopsoas", "left_iliopsoas"],
-            "quadriceps": ["right_quadriceps", "left_quadriceps"],
-            "hamstrings": ["right_hamstrings", "left_hamstrings"],
-            "tibialis anterior": ["right_tibialis_ant", "left_tibialis_ant"],
-            "gastrocnemius": ["right_gastrocnemius", "left_gastrocnemius"]
-        }
-
-        for muscle_name, muscle_fields in muscles.items():
-            pattern = re.compile(
-                rf'\b(left|right|bilateral)?\s*{muscle_name}\s*[:\-]?\s*(\d[+-]?)/5',
-                re.IGNORECASE
-            )
+        for muscle_name, muscle_fields in NeuroExamExtractor.MUSCLES.items():
+            pattern = NeuroExamExtractor.MOTOR_PATTERNS[muscle_name]
 
             for match in pattern.finditer(text):
                 laterality = match.group(1).lower() if match.group(1) else None
@@ -771,9 +1142,9 @@ class NeuroExamExtractor:
                     motor_exam=motor_exam
                 )
 
-                fact = AtomicClinicalFact(
+                fact = AtomicClinicalFact.model_construct(
                     entity_type=EntityType.PHYSICAL_EXAM,
-                    entity_name=f"{muscle_name} strength",
+                    entity_name=sys.intern(f"{muscle_name} strength"),
                     extracted_text=match.group(0),
                     source_snippet=context,
                     confidence_score=0.9,
@@ -915,7 +1286,24 @@ class HybridExtractionEngine:
         # Initialize LLM client for enhanced extraction
         self.llm_client = LLMExtractionClient()
 
-    def extract_all_facts(self, text: str, patient_id: int, document_id: int) -> List[AtomicClinicalFact]:
+    def _cache_context(self) -> Tuple[Any, ...]:
+        """Settings and model availability that change extraction output, for the result cache key"""
+        return (
+            settings.extraction_use_ner and self.ner_models.scispacy_model is not None,
+            settings.extraction_use_llm and self.llm_client.provider,
+            settings.extraction_use_llm and self.llm_client.openai_client is not None,
+            settings.extraction_use_llm and self.llm_client.anthropic_client is not None,
+            settings.extraction_min_confidence,
+            settings.extraction_lexicon_backend,
+        )
+
+    def extract_all_facts(
+        self,
+        text: str,
+        patient_id: int,
+        document_id: int,
+        doc: Optional[Doc] = None
+    ) -> List[AtomicClinicalFact]:
         """
         Extract all clinical facts from text using hybrid approach
 
@@ -923,6 +1311,7 @@ class HybridExtractionEngine:
             text: Clinical text to extract from
             patient_id: Patient ID
             document_id: Document ID
+            doc: Pre-parsed scispaCy doc for text (parsed here if not given)
 
         Returns:
             List of extracted atomic clinical facts
@@ -930,12 +1319,26 @@ class HybridExtractionEngine:
         logger.info(f"Starting extraction for document {document_id}")
         all_facts = []
 
+        cache_key = extraction_result_cache.key(text, self._cache_context())
+        cached_facts = extraction_result_cache.get(cache_key)
+        if cached_facts is not None:
+            logger.info(f"Extraction cache hit for document {document_id}: {len(cached_facts)} facts")
+            return cached_facts
+
         try:
+            # Start the LLM request first; it is I/O-bound and runs while the
+            # CPU-bound extractors below work on this thread
+            llm_future = None
+            if settings.extraction_use_llm:
+                llm_future = llm_extraction_executor.submit(
+                    self.llm_client.extract_with_llm,
+                    text,
+                    [EntityType.SYMPTOM, EntityType.IMAGING_FINDING, EntityType.COMPLICATION]
+                )
+
             # Process text with spaCy models
-            if settings.extraction_use_ner and self.ner_models.scispacy_model:
+            if doc is None and settings.extraction_use_ner and self.ner_models.scispacy_model:
                 doc = self.ner_models.scispacy_model(text)
-            else:
-                doc = None
 
             # 1. Extract diagnoses (NER-based)
             if doc:
@@ -969,15 +1372,19 @@ class HybridExtractionEngine:
             logger.info(f"Extracted {len(motor_facts)} motor exam findings")
 
             # 7. Use LLM for complex entities (symptoms, findings, complications)
-            if settings.extraction_use_llm:
-                llm_facts = self.llm_client.extract_with_llm(
-                    text,
-                    [EntityType.SYMPTOM, EntityType.IMAGING_FINDING, EntityType.COMPLICATION]
-                )
+            if llm_future is not None:
+                llm_facts = llm_future.result()
                 all_facts.extend(llm_facts)
                 logger.info(f"Extracted {len(llm_facts)} facts via LLM")
 
-            # 8. Add temporal context to all facts
+            # 8. Filter by confidence threshold before any per-fact work, so
+            # dropped facts cost no context scans and cannot shadow kept
+            # ones during deduplication
+            min_confidence = settings.extraction_min_confidence
+            all_facts = [f for f in all_facts if f.confidence_score >= min_confidence]
+            logger.info(f"After confidence filtering: {len(all_facts)} facts")
+
+            # 9. Add temporal context to all facts
             for fact in all_facts:
                 if not fact.temporal_context:  # Don't overwrite if LLM provided it
                     temporal_context = TemporalExtractor.extract_temporal_context(
@@ -986,26 +1393,64 @@ class HybridExtractionEngine:
                     if temporal_context:
                         fact.temporal_context = temporal_context.dict()
 
-            # 9. Deduplicate facts
+            # 10. Deduplicate facts
             deduplicated_facts = self._deduplicate_facts(all_facts)
             logger.info(f"After deduplication: {len(deduplicated_facts)} facts")
 
-            # 10. Filter by confidence threshold
-            high_confidence_facts = [
-                f for f in deduplicated_facts
-                if f.confidence_score >= settings.extraction_min_confidence
-            ]
-            logger.info(f"After confidence filtering: {len(high_confidence_facts)} facts")
-
-            return high_confidence_facts
+            extraction_result_cache.put(cache_key, deduplicated_facts)
+            return deduplicated_facts
 
         except Exception as e:
             logger.error(f"Error in extraction pipeline: {e}", exc_info=True)
             return []
 
+    def extract_all_facts_batch(self, documents: List[Dict[str, Any]]) -> List[List[AtomicClinicalFact]]:
+        """
+        Extract facts from several documents, running NER through nlp.pipe
+
+        Args:
+            documents: Documents with text, patient_id, document_id
+
+        Returns:
+            Fact lists, one per document in input order
+        """
+        # Serve cached documents first so only the misses are parsed
+        context = self._cache_context()
+        results = [
+            extraction_result_cache.get(extraction_result_cache.key(d["text"], context))
+            for d in documents
+        ]
+        misses = [i for i, facts in enumerate(results) if facts is None]
+        logger.info(f"Batch extraction: {len(documents) - len(misses)} cached, {len(misses)} to extract")
+
+        # Batch tokenization + NER across the uncached documents
+        if misses and settings.extraction_use_ner and self.ner_models.scispacy_model:
+            docs = self.ner_models.scispacy_model.pipe(
+                (documents[i]["text"] for i in misses), batch_size=NER_PIPE_BATCH_SIZE
+            )
+        else:
+            docs = (None for _ in misses)
+
+        for i, doc in zip(misses, docs):
+            d = documents[i]
+            results[i] = self.extract_all_facts(d["text"], d["patient_id"], d["document_id"], doc=doc)
+
+        return results
+
+    @staticmethod
+    def _dedup_key(fact: AtomicClinicalFact) -> Tuple[Any, ...]:
+        """Hashable identity of a fact: type, normalized name and dose"""
+        medication_detail = fact.medication_detail or {}
+        return (
+            fact.entity_type,
+            re.sub(r'\W+', '', fact.entity_name.lower()),
+            medication_detail.get("dose_value"),
+            medication_detail.get("dose_unit")
+        )
+
     def _deduplicate_facts(self, facts: List[AtomicClinicalFact]) -> List[AtomicClinicalFact]:
         """
-        Deduplicate extracted facts based on entity name and position
+        Deduplicate extracted facts based on entity name, dose and position
 
         Args:
             facts: List of facts to deduplicate
@@ -1016,41 +1461,27 @@ class HybridExtractionEngine:
         if not facts:
             return []
 
-        # Group by entity type and name
-        fact_groups: Dict[Tuple[str, str], List[AtomicClinicalFact]] = {}
+        # Group by hashable key in a single pass
+        fact_groups: Dict[Tuple[Any, ...], List[AtomicClinicalFact]] = {}
 
         for fact in facts:
-            key = (fact.entity_type, fact.entity_name.lower())
-            if key not in fact_groups:
-                fact_groups[key] = []
-            fact_groups[key].append(fact)
+            fact_groups.setdefault(self._dedup_key(fact), []).append(fact)
 
-        # For each group, keep the highest confidence fact
-        # or merge if they're from different positions
+        # Within a group, mentions less than 50 chars after the last kept one
+        # are the same mention; sorting by position makes this one comparison
         deduplicated = []
 
-        for key, group in fact_groups.items():
+        for group in fact_groups.values():
             if len(group) == 1:
                 deduplicated.append(group[0])
-            else:
-                # Check if facts are from different positions (> 50 chars apart)
-                positions = [(f.char_start or 0, f.char_end or 0) for f in group]
-                unique_positions = []
-
-                for i, (start, end) in enumerate(positions):
-                    is_unique = True
-                    for unique_start, unique_end in unique_positions:
-                        if abs(start - unique_start) < 50:
-                            is_unique = False
-                            break
-                    if is_unique:
-                        unique_positions.append((start, end))
-                        deduplicated.append(group[i])
-
-                # If all from same position, keep highest confidence
-                if not unique_positions:
-                    best_fact = max(group, key=lambda f: f.confidence_score)
-                    deduplicated.append(best_fact)
+                continue
+
+            last_start = None
+            for fact in sorted(group, key=lambda f: f.char_start or 0):
+                start = fact.char_start or 0
+                if last_start is None or start - last_start >= 50:
+                    deduplicated.append(fact)
+                    last_start = start
 
         return deduplicated
 
@@ -1094,3 +1525,17 @@ def extract_clinical_facts(
     """
     engine = HybridExtractionEngine()
     return engine.extract_all_facts(text, patient_id, document_id)
+
+
+def extract_clinical_facts_batch(documents: List[Dict[str, Any]]) -> List[List[AtomicClinicalFact]]:
+    """
+    Batched entry point for clinical fact extraction
+
+    Args:
+        documents: Documents with text, patient_id, document_id
+
+    Returns:
+        Fact lists, one per document in input order
+    """
+    engine = HybridExtractionEngine()
+    return engine.extract_all_facts_batch(documents)
@@ -164,13 +164,16 @@ class AccuracyValidator:
         total_facts = len(facts)
         accurate_facts = 0
 
+        # Lowercase the (possibly multi-document) source once, not per fact
+        source_lower = source_text.lower()
+
         for fact in facts:
             # Check if extracted text is in source
-            if fact.extracted_text and fact.extracted_text.lower() in source_text.lower():
+            if fact.extracted_text and fact.extracted_text.lower() in source_lower:
                 accurate_facts += 1
             else:
                 # Check source snippet
-                if fact.source_snippet and fact.source_snippet.lower() in source_text.lower():
+                if fact.source_snippet and fact.source_snippet.lower() in source_lower:
                     accurate_facts += 1
                 else:
                     issue = ValidationIssue(
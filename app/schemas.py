@@ -401,14 +401,16 @@ class AtomicClinicalFact(BaseModel):
     timestamp: Optional[datetime] = Field(None, description="Document timestamp")
     resolved_timestamp: Optional[datetime] = Field(None, description="Resolved clinical timestamp")
 
-    # Detailed schemas (optional based on entity type)
-    anatomical_context: Optional[AnatomicalContext] = None
-    medication_detail: Optional[MedicationDetail] = None
-    imaging_detail: Optional[ImagingFinding] = None
-    procedure_detail: Optional[ProcedureDetail] = None
-    lab_value: Optional[LabValue] = None
-    neuro_exam_detail: Optional[NeuroExamDetail] = None
-    temporal_context: Optional[TemporalContext] = None
+    # Detailed schemas (optional based on entity type), stored as plain dicts
+    # shaped by the named model (dumped by the extractors, JSONB in the
+    # database) and read with .get() throughout
+    anatomical_context: Optional[Dict[str, Any]] = Field(None, description="AnatomicalContext fields")
+    medication_detail: Optional[Dict[str, Any]] = Field(None, description="MedicationDetail fields")
+    imaging_detail: Optional[Dict[str, Any]] = Field(None, description="ImagingFinding fields")
+    procedure_detail: Optional[Dict[str, Any]] = Field(None, description="ProcedureDetail fields")
+    lab_value: Optional[Dict[str, Any]] = Field(None, description="LabValue fields")
+    neuro_exam_detail: Optional[Dict[str, Any]] = Field(None, description="NeuroExamDetail fields")
+    temporal_context: Optional[Dict[str, Any]] = Field(None, description="TemporalContext fields")
 
     # Metadata
     is_negated: bool = False
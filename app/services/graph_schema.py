@@ -0,0 +1,69 @@
+"""
+NeuroscribeAI - Knowledge Graph Schema
+Neo4j constraints and indexes (import-safe: opens no connections)
+"""
+
+import logging
+from neo4j import GraphDatabase, Session
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Constraints for uniqueness
+GRAPH_CONSTRAINTS = [
+    "CREATE CONSTRAINT patient_id_unique IF NOT EXISTS FOR (p:Patient) REQUIRE p.id IS UNIQUE",
+    "CREATE CONSTRAINT diagnosis_id_unique IF NOT EXISTS FOR (d:Diagnosis) REQUIRE d.id IS UNIQUE",
+    "CREATE CONSTRAINT procedure_id_unique IF NOT EXISTS FOR (pr:Procedure) REQUIRE pr.id IS UNIQUE",
+    "CREATE CONSTRAINT medication_id_unique IF NOT EXISTS FOR (m:Medication) REQUIRE m.id IS UNIQUE",
+]
+
+# Indexes for query performance
+GRAPH_INDEXES = [
+    "CREATE INDEX patient_mrn_idx IF NOT EXISTS FOR (p:Patient) ON (p.mrn)",
+    "CREATE INDEX diagnosis_name_idx IF NOT EXISTS FOR (d:Diagnosis) ON (d.name)",
+    "CREATE INDEX procedure_name_idx IF NOT EXISTS FOR (pr:Procedure) ON (pr.name)",
+    "CREATE INDEX medication_name_idx IF NOT EXISTS FOR (m:Medication) ON (m.generic_name)",
+    "CREATE INDEX lab_test_idx IF NOT EXISTS FOR (l:LabValue) ON (l.test_name)",
+    # Fact node ids (MERGE key during sync) for labels without a uniqueness constraint
+    "CREATE INDEX lab_value_id_idx IF NOT EXISTS FOR (l:LabValue) ON (l.id)",
+    "CREATE INDEX physical_exam_id_idx IF NOT EXISTS FOR (e:PhysicalExam) ON (e.id)",
+    "CREATE INDEX imaging_finding_id_idx IF NOT EXISTS FOR (i:ImagingFinding) ON (i.id)",
+    "CREATE INDEX symptom_id_idx IF NOT EXISTS FOR (s:Symptom) ON (s.id)",
+    "CREATE INDEX vital_sign_id_idx IF NOT EXISTS FOR (v:VitalSign) ON (v.id)",
+    "CREATE INDEX clinical_fact_id_idx IF NOT EXISTS FOR (c:ClinicalFact) ON (c.id)",
+]
+
+# Full-text search indexes
+GRAPH_FULLTEXT_INDEXES = [
+    """CREATE FULLTEXT INDEX entity_fulltext_idx IF NOT EXISTS
+       FOR (n:Diagnosis|Procedure|Medication|Symptom)
+       ON EACH [n.name, n.extracted_text]""",
+]
+
+
+def create_graph_schema(session: Session):
+    """Create all constraints and indexes (idempotent)"""
+    for constraint in GRAPH_CONSTRAINTS:
+        session.run(constraint)
+        logger.info(f"Created constraint: {constraint[:50]}...")
+
+    for index in GRAPH_INDEXES:
+        session.run(index)
+        logger.info(f"Created index: {index[:50]}...")
+
+    for ft_index in GRAPH_FULLTEXT_INDEXES:
+        session.run(ft_index)
+        logger.info("Created fulltext index for entity search")
+
+    logger.info("✓ Neo4j graph schema initialized successfully")
+
+
+def ensure_graph_schema():
+    """Create the graph schema over a short-lived driver (safe before forking)"""
+    with GraphDatabase.driver(
+        settings.neo4j_uri,
+        auth=(settings.neo4j_user, settings.neo4j_password)
+    ) as driver:
+        with driver.session(database=settings.neo4j_database) as session:
+            create_graph_schema(session)
@@ -3,17 +3,77 @@ NeuroscribeAI - Neo4j Knowledge Graph Service
 Builds and queries clinical knowledge graphs from extracted facts
 """
 
+import csv
 import logging
-from typing import List, Dict, Optional, Any, Tuple
+import os
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Dict, Optional, Any, Tuple, Iterable
 from datetime import datetime, timedelta
 from neo4j import GraphDatabase, Driver, Session
 from neo4j.exceptions import ServiceUnavailable, AuthError
 
 from app.config import settings
 from app.schemas import AtomicClinicalFact, EntityType
+from app.services.graph_schema import create_graph_schema
 
 logger = logging.getLogger(__name__)
 
+# Node label per entity type
+FACT_LABELS = {
+    EntityType.DIAGNOSIS: "Diagnosis",
+    EntityType.PROCEDURE: "Procedure",
+    EntityType.MEDICATION: "Medication",
+    EntityType.LAB_VALUE: "LabValue",
+    EntityType.PHYSICAL_EXAM: "PhysicalExam",
+    EntityType.IMAGING: "ImagingFinding",
+    EntityType.IMAGING_FINDING: "ImagingFinding",
+    EntityType.SYMPTOM: "Symptom",
+    EntityType.VITAL_SIGN: "VitalSign"
+}
+DEFAULT_FACT_LABEL = "ClinicalFact"
+
+# Patient -> entity relationship type per entity type
+FACT_RELATIONSHIPS = {
+    EntityType.DIAGNOSIS: "HAS_DIAGNOSIS",
+    EntityType.PROCEDURE: "UNDERWENT_PROCEDURE",
+    EntityType.MEDICATION: "TAKES_MEDICATION",
+    EntityType.LAB_VALUE: "HAS_LAB",
+    EntityType.PHYSICAL_EXAM: "HAS_EXAM",
+    EntityType.IMAGING: "HAS_IMAGING",
+    EntityType.SYMPTOM: "EXHIBITS_SYMPTOM"
+}
+DEFAULT_FACT_RELATIONSHIP = "HAS_FACT"
+
+# Number of facts sent per UNWIND statement during bulk sync
+GRAPH_SYNC_BATCH_SIZE = 1000
+
+# UNWIND batches in flight at once during bulk sync (each on its own session)
+GRAPH_SYNC_MAX_IN_FLIGHT = 8
+
+# LOAD CSV sync: rows per inner transaction, and Cypher casts for non-string
+# columns (CSV values are all strings; empty cells become null)
+GRAPH_SYNC_CSV_TX_ROWS = 10000
+CSV_NODE_CASTS = {
+    "id": "toInteger",
+    "patient_id": "toInteger",
+    "confidence": "toFloat",
+    "is_negated": "toBoolean",
+    "is_historical": "toBoolean",
+    "size_mm": "toFloat",
+    "dose_value": "toFloat",
+    "pod": "toInteger",
+    "hospital_day": "toInteger",
+}
+CSV_REL_CASTS = {
+    "confidence": "toFloat",
+    "pod": "toInteger",
+}
+
+
+class GraphSyncError(RuntimeError):
+    """One or more fact batches failed to write; raised so the sync task retries"""
+
 
 # =============================================================================
 # Neo4j Connection Manager
@@ -98,45 +158,8 @@ class Neo4jGraphService:
     def initialize_graph_schema(self):
         """Create indexes and constraints for optimal query performance"""
         with self.connection.get_session() as session:
-            # Constraints for uniqueness
-            constraints = [
-                "CREATE CONSTRAINT patient_id_unique IF NOT EXISTS FOR (p:Patient) REQUIRE p.id IS UNIQUE",
-                "CREATE CONSTRAINT diagnosis_id_unique IF NOT EXISTS FOR (d:Diagnosis) REQUIRE d.id IS UNIQUE",
-                "CREATE CONSTRAINT procedure_id_unique IF NOT EXISTS FOR (pr:Procedure) REQUIRE pr.id IS UNIQUE",
-                "CREATE CONSTRAINT medication_id_unique IF NOT EXISTS FOR (m:Medication) REQUIRE m.id IS UNIQUE",
-            ]
-
-            # Indexes for query performance
-            indexes = [
-                "CREATE INDEX patient_mrn_idx IF NOT EXISTS FOR (p:Patient) ON (p.mrn)",
-                "CREATE INDEX diagnosis_name_idx IF NOT EXISTS FOR (d:Diagnosis) ON (d.name)",
-                "CREATE INDEX procedure_name_idx IF NOT EXISTS FOR (pr:Procedure) ON (pr.name)",
-                "CREATE INDEX medication_name_idx IF NOT EXISTS FOR (m:Medication) ON (m.generic_name)",
-                "CREATE INDEX lab_test_idx IF NOT EXISTS FOR (l:LabValue) ON (l.test_name)",
-            ]
-
-            # Full-text search indexes
-            fulltext_indexes = [
-                """CREATE FULLTEXT INDEX entity_fulltext_idx IF NOT EXISTS
-                   FOR (n:Diagnosis|Procedure|Medication|Symptom)
-                   ON EACH [n.name, n.extracted_text]""",
-            ]
-
             try:
-                for constraint in constraints:
-                    session.run(constraint)
-                    logger.info(f"Created constraint: {constraint[:50]}...")
-
-                for index in indexes:
-                    session.run(index)
-                    logger.info(f"Created index: {index[:50]}...")
-
-                for ft_index in fulltext_indexes:
-                    session.run(ft_index)
-                    logger.info("Created fulltext index for entity search")
-
-                logger.info("✓ Neo4j graph schema initialized successfully")
-
+                create_graph_schema(session)
             except Exception as e:
                 logger.error(f"Error initializing graph schema: {e}")
                 raise
@@ -176,19 +199,7 @@ class Neo4jGraphService:
         """Create entity node from clinical fact"""
         with self.connection.get_session() as session:
             # Determine node label based on entity type
-            label_map = {
-                EntityType.DIAGNOSIS: "Diagnosis",
-                EntityType.PROCEDURE: "Procedure",
-                EntityType.MEDICATION: "Medication",
-                EntityType.LAB_VALUE: "LabValue",
-                EntityType.PHYSICAL_EXAM: "PhysicalExam",
-                EntityType.IMAGING: "ImagingFinding",
-                EntityType.IMAGING_FINDING: "ImagingFinding",
-                EntityType.SYMPTOM: "Symptom",
-                EntityType.VITAL_SIGN: "VitalSign"
-            }
-
-            label = label_map.get(fact.entity_type, "ClinicalFact")
+            label = FACT_LABELS.get(fact.entity_type, DEFAULT_FACT_LABEL)
 
             # Build properties dict
             properties = {
@@ -242,17 +253,7 @@ class Neo4jGraphService:
         """Create relationship from Patient to entity node"""
         with self.connection.get_session() as session:
             # Relationship type based on entity type
-            rel_type_map = {
-                EntityType.DIAGNOSIS: "HAS_DIAGNOSIS",
-                EntityType.PROCEDURE: "UNDERWENT_PROCEDURE",
-                EntityType.MEDICATION: "TAKES_MEDICATION",
-                EntityType.LAB_VALUE: "HAS_LAB",
-                EntityType.PHYSICAL_EXAM: "HAS_EXAM",
-                EntityType.IMAGING: "HAS_IMAGING",
-                EntityType.SYMPTOM: "EXHIBITS_SYMPTOM"
-            }
-
-            rel_type = rel_type_map.get(fact.entity_type, "HAS_FACT")
+            rel_type = FACT_RELATIONSHIPS.get(fact.entity_type, DEFAULT_FACT_RELATIONSHIP)
 
             # Relationship properties
             rel_props = {
@@ -410,6 +411,387 @@ class Neo4jGraphService:
             stats["errors"] += 1
             return stats
 
+    @staticmethod
+    def _fact_row(patient_id: int, fact: Dict[str, Any]) -> Dict[str, Any]:
+        """Build UNWIND row (node + relationship properties) from a fact column mapping"""
+        anatomical = fact.get("anatomical_context") or {}
+        medication = fact.get("medication_detail") or {}
+        temporal = fact.get("temporal_context") or {}
+
+        properties = {
+            "id": fact["id"],
+            "patient_id": patient_id,
+            "name": fact["entity_name"],
+            "extracted_text": fact["extracted_text"],
+            "confidence": fact["confidence_score"],
+            "extraction_method": fact["extraction_method"],
+            "is_negated": fact["is_negated"],
+            "is_historical": fact["is_historical"],
+            "laterality": anatomical.get("laterality"),
+            "brain_region": anatomical.get("brain_region"),
+            "size_mm": anatomical.get("size_mm"),
+            "generic_name": medication.get("generic_name"),
+            "dose_value": medication.get("dose_value"),
+            "dose_unit": medication.get("dose_unit"),
+            "frequency": medication.get("frequency"),
+            "pod": temporal.get("pod"),
+            "hospital_day": temporal.get("hospital_day"),
+        }
+
+        rel_properties = {
+            "confidence": fact["confidence_score"],
+            "source_method": fact["extraction_method"],
+            "created_at": datetime.now().isoformat(),
+            "pod": temporal.get("pod"),
+            "event_date": temporal.get("timestamp"),
+        }
+
+        return {
+            "id": fact["id"],
+            "patient_id": patient_id,
+            "properties": properties,
+            "rel_properties": rel_properties
+        }
+
+    @staticmethod
+    def _write_fact_batch(tx, grouped_rows: Dict[Tuple[str, str], List[Dict]]) -> int:
+        """Write one batch of facts (one UNWIND per label/relationship pair)"""
+        nodes_created = 0
+        for (label, rel_type), rows in grouped_rows.items():
+            cypher = f"""
+            UNWIND $rows AS row
+            MATCH (p:Patient {{id: row.patient_id}})
+            MERGE (e:{label} {{id: row.id}})
+            SET e += row.properties
+            MERGE (p)-[r:{rel_type}]->(e)
+            SET r += row.rel_properties
+            """
+            summary = tx.run(cypher, rows=rows).consume()
+            nodes_created += summary.counters.nodes_created
+        return nodes_created
+
+    def _sync_fact_batch(self, grouped_rows: Dict[Tuple[str, str], List[Dict]]) -> int:
+        """Write one fact batch in its own session (safe to run concurrently)"""
+        with self.connection.get_session() as session:
+            return session.execute_write(self._write_fact_batch, grouped_rows)
+
+    def _pipeline_fact_batches(
+        self,
+        fact_batches: Iterable[List[Dict[str, Any]]],
+        stats: Dict[str, int],
+        patient_id: Optional[int] = None
+    ):
+        """
+        Write fact batches with up to GRAPH_SYNC_MAX_IN_FLIGHT transactions outstanding
+
+        Args:
+            fact_batches: Batches of fact column mappings
+            stats: Sync statistics to update
+            patient_id: Patient for every fact; when None each fact carries "patient_id"
+
+        Raises:
+            GraphSyncError: If any batch failed (after all batches have finished)
+        """
+        failed_patient_ids = set()
+
+        def collect(future: Future, batch_size: int, batch_patient_ids: set):
+            try:
+                stats["nodes_created"] += future.result()
+                stats["relationships_created"] += batch_size
+            except Exception as e:
+                logger.error(f"Error syncing fact batch for patient(s) "
+                             f"{sorted(batch_patient_ids)}: {e}")
+                stats["errors"] += batch_size
+                failed_patient_ids.update(batch_patient_ids)
+
+        # The next batch is read from the source iterator while earlier ones
+        # commit. Threads become greenlets on the gevent worker pool.
+        in_flight: Dict[Future, Tuple[int, set]] = {}
+        with ThreadPoolExecutor(max_workers=GRAPH_SYNC_MAX_IN_FLIGHT) as executor:
+            for batch in fact_batches:
+                grouped_rows: Dict[Tuple[str, str], List[Dict]] = {}
+                batch_patient_ids = set()
+                for fact in batch:
+                    key = (
+                        FACT_LABELS.get(fact["entity_type"], DEFAULT_FACT_LABEL),
+                        FACT_RELATIONSHIPS.get(fact["entity_type"], DEFAULT_FACT_RELATIONSHIP)
+                    )
+                    fact_patient_id = patient_id if patient_id is not None else fact["patient_id"]
+                    grouped_rows.setdefault(key, []).append(self._fact_row(fact_patient_id, fact))
+                    batch_patient_ids.add(fact_patient_id)
+
+                if len(in_flight) >= GRAPH_SYNC_MAX_IN_FLIGHT:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future, *in_flight.pop(future))
+
+                future = executor.submit(self._sync_fact_batch, grouped_rows)
+                in_flight[future] = (len(batch), batch_patient_ids)
+
+            for future, (batch_size, batch_patient_ids) in in_flight.items():
+                collect(future, batch_size, batch_patient_ids)
+
+        # MERGE makes re-syncing idempotent, so the task can safely retry
+        if failed_patient_ids:
+            raise GraphSyncError(
+                f"{stats['errors']} facts failed to sync for patient(s) {sorted(failed_patient_ids)}"
+            )
+
+    def sync_patient_to_graph_bulk(
+        self,
+        patient_id: int,
+        patient_data: Dict[str, Any],
+        fact_batches: Iterable[List[Dict[str, Any]]]
+    ) -> Dict[str, int]:
+        """
+        Sync patient and facts to Neo4j with one UNWIND statement per batch
+
+        Args:
+            patient_id: PostgreSQL patient ID
+            patient_data: Patient demographics
+            fact_batches: Batches of fact column mappings (must include "id")
+
+        Returns:
+            Dict with sync statistics
+
+        Raises:
+            GraphSyncError: If any part of the sync failed
+        """
+        stats = {
+            "nodes_created": 0,
+            "relationships_created": 0,
+            "errors": 0
+        }
+
+        try:
+            self.create_patient_node(patient_data)
+            stats["nodes_created"] += 1
+
+            self._pipeline_fact_batches(fact_batches, stats, patient_id=patient_id)
+
+            # Infer clinical logic and temporal relationships
+            self.infer_clinical_relationships(patient_id)
+            self.build_temporal_relationships(patient_id)
+
+            logger.info(f"✓ Bulk graph sync complete: {stats['nodes_created']} nodes, "
+                       f"{stats['relationships_created']} relationships, {stats['errors']} errors")
+
+            return stats
+
+        except GraphSyncError:
+            # Failed fact batches propagate so the Celery task retries
+            raise
+
+        except Exception as e:
+            # Patient node, fact source or inference failures also leave the
+            # graph incomplete, so they are raised too
+            logger.error(f"Bulk graph sync failed for patient {patient_id}: {e}", exc_info=True)
+            raise GraphSyncError(f"Bulk graph sync failed for patient {patient_id}: {e}") from e
+
+    def sync_patients_to_graph_bulk(
+        self,
+        patients: List[Dict[str, Any]],
+        fact_batches: Iterable[List[Dict[str, Any]]]
+    ) -> Dict[str, int]:
+        """
+        Sync many patients in one pass: one UNWIND for all patient nodes, then
+        a single pipelined stream of fact batches spanning patients
+
+        Args:
+            patients: Patient demographics (each with "id")
+            fact_batches: Batches of fact column mappings, each with "patient_id"
+
+        Returns:
+            Dict with sync statistics
+
+        Raises:
+            GraphSyncError: If any part of the sync failed
+        """
+        stats = {
+            "nodes_created": 0,
+            "relationships_created": 0,
+            "errors": 0
+        }
+
+        try:
+            with self.connection.get_session() as session:
+                summary = session.run(
+                    """
+                    UNWIND $patients AS patient
+                    MERGE (p:Patient {id: patient.id})
+                    SET p.mrn = patient.mrn,
+                        p.age = patient.age,
+                        p.sex = patient.sex,
+                        p.primary_diagnosis = patient.primary_diagnosis,
+                        p.updated_at = datetime(patient.updated_at)
+                    """,
+                    patients=[
+                        {**p, "updated_at": (p.get("updated_at") or datetime.now()).isoformat()}
+                        for p in patients
+                    ]
+                ).consume()
+                stats["nodes_created"] += summary.counters.nodes_created
+
+            self._pipeline_fact_batches(fact_batches, stats)
+
+            # Infer clinical logic and temporal relationships
+            for patient in patients:
+                self.infer_clinical_relationships(patient["id"])
+                self.build_temporal_relationships(patient["id"])
+
+            logger.info(f"✓ Batch graph sync complete for {len(patients)} patients: "
+                       f"{stats['nodes_created']} nodes, {stats['relationships_created']} relationships, "
+                       f"{stats['errors']} errors")
+
+            return stats
+
+        except GraphSyncError:
+            # Failed fact batches propagate so the Celery task retries
+            raise
+
+        except Exception as e:
+            # Patient node, fact source or inference failures also leave the
+            # graph incomplete, so they are raised too
+            logger.error(f"Batch graph sync failed: {e}", exc_info=True)
+            raise GraphSyncError(f"Batch graph sync failed: {e}") from e
+
+    @staticmethod
+    def _csv_set_clause(variable: str, prefix: str, fields: List[str], casts: Dict[str, str]) -> str:
+        """Build a SET clause mapping CSV columns back to typed properties"""
+        assignments = []
+        for field in fields:
+            column = f"row.{prefix}{field}"
+            if field in casts:
+                value = f"{casts[field]}({column})"
+            else:
+                value = f"CASE {column} WHEN '' THEN null ELSE {column} END"
+            assignments.append(f"{variable}.{field} = {value}")
+        return "SET " + ", ".join(assignments)
+
+    def sync_patient_to_graph_csv(
+        self,
+        patient_id: int,
+        patient_data: Dict[str, Any],
+        facts: Iterable[Dict[str, Any]],
+        import_dir: str
+    ) -> Dict[str, int]:
+        """
+        Sync a very large patient via LOAD CSV instead of Bolt parameter batches
+
+        Facts are written to one CSV per label/relationship pair in the Neo4j
+        import directory (shared volume), then loaded server-side with
+        CALL { ... } IN TRANSACTIONS.
+
+        Args:
+            patient_id: PostgreSQL patient ID
+            patient_data: Patient demographics
+            facts: Fact column mappings (must include "id"), streamed
+            import_dir: Local path of the Neo4j server's import directory
+
+        Returns:
+            Dict with sync statistics
+
+        Raises:
+            GraphSyncError: If any file failed to load or the sync failed
+        """
+        stats = {
+            "nodes_created": 0,
+            "relationships_created": 0,
+            "errors": 0
+        }
+
+        prefix = f"patient_{patient_id}_{uuid.uuid4().hex}"
+        files: Dict[Tuple[str, str], Tuple[str, Any, Any]] = {}
+        node_fields: List[str] = []
+        rel_fields: List[str] = []
+
+        try:
+            self.create_patient_node(patient_data)
+            stats["nodes_created"] += 1
+
+            # Stream facts into per-label CSV files
+            for fact in facts:
+                row = self._fact_row(patient_id, fact)
+                key = (
+                    FACT_LABELS.get(fact["entity_type"], DEFAULT_FACT_LABEL),
+                    FACT_RELATIONSHIPS.get(fact["entity_type"], DEFAULT_FACT_RELATIONSHIP)
+                )
+                if not node_fields:
+                    node_fields = list(row["properties"])
+                    rel_fields = list(row["rel_properties"])
+
+                if key not in files:
+                    filename = f"{prefix}_{key[0]}.csv"
+                    handle = open(os.path.join(import_dir, filename), "w", newline="")
+                    writer = csv.writer(handle)
+                    writer.writerow(node_fields + [f"rel_{f}" for f in rel_fields])
+                    files[key] = (filename, handle, writer)
+
+                files[key][2].writerow(
+                    [row["properties"][f] for f in node_fields] +
+                    [row["rel_properties"][f] for f in rel_fields]
+                )
+
+            for _, handle, _ in files.values():
+                handle.close()
+
+            # Load each file server-side
+            with self.connection.get_session() as session:
+                for (label, rel_type), (filename, _, _) in files.items():
+                    cypher = f"""
+                    LOAD CSV WITH HEADERS FROM $url AS row
+                    CALL {{
+                        WITH row
+                        MATCH (p:Patient {{id: $patient_id}})
+                        MERGE (e:{label} {{id: toInteger(row.id)}})
+                        {self._csv_set_clause("e", "", node_fields, CSV_NODE_CASTS)}
+                        MERGE (p)-[r:{rel_type}]->(e)
+                        {self._csv_set_clause("r", "rel_", rel_fields, CSV_REL_CASTS)}
+                    }} IN TRANSACTIONS OF {GRAPH_SYNC_CSV_TX_ROWS} ROWS
+                    """
+                    try:
+                        summary = session.run(
+                            cypher, url=f"file:///{filename}", patient_id=patient_id
+                        ).consume()
+                        stats["nodes_created"] += summary.counters.nodes_created
+                        stats["relationships_created"] += summary.counters.relationships_created
+                    except Exception as e:
+                        logger.error(f"Error loading {filename} for patient {patient_id}: {e}")
+                        stats["errors"] += 1
+
+            # Raised once every file has been tried; MERGE makes the retry idempotent
+            if stats["errors"]:
+                raise GraphSyncError(
+                    f"{stats['errors']} LOAD CSV files failed to sync for patient {patient_id}"
+                )
+
+            # Infer clinical logic and temporal relationships
+            self.infer_clinical_relationships(patient_id)
+            self.build_temporal_relationships(patient_id)
+
+            logger.info(f"✓ LOAD CSV graph sync complete: {stats['nodes_created']} nodes, "
+                       f"{stats['relationships_created']} relationships, {stats['errors']} errors")
+
+            return stats
+
+        except GraphSyncError:
+            # Failed file loads propagate so the Celery task retries
+            raise
+
+        except Exception as e:
+            # Patient node, CSV staging or inference failures also leave the
+            # graph incomplete, so they are raised too
+            logger.error(f"LOAD CSV graph sync failed for patient {patient_id}: {e}", exc_info=True)
+            raise GraphSyncError(f"LOAD CSV graph sync failed for patient {patient_id}: {e}") from e
+
+        finally:
+            for filename, handle, _ in files.values():
+                handle.close()
+                try:
+                    os.remove(os.path.join(import_dir, filename))
+                except OSError:
+                    pass
+
     # =========================================================================
     # Query Methods
     # =========================================================================
@@ -601,6 +983,63 @@ def sync_patient_facts_to_graph(
     return neo4j_service.sync_patient_to_graph(patient_id, patient_data, facts)
 
 
+def sync_patient_facts_to_graph_bulk(
+    patient_id: int,
+    patient_data: Dict[str, Any],
+    fact_batches: Iterable[List[Dict[str, Any]]]
+) -> Dict[str, int]:
+    """
+    Public API for batched patient sync to knowledge graph
+
+    Args:
+        patient_id: PostgreSQL patient ID
+        patient_data: Patient demographics
+        fact_batches: Batches of fact column mappings
+
+    Returns:
+        Sync statistics
+    """
+    return neo4j_service.sync_patient_to_graph_bulk(patient_id, patient_data, fact_batches)
+
+
+def sync_patients_facts_to_graph_bulk(
+    patients: List[Dict[str, Any]],
+    fact_batches: Iterable[List[Dict[str, Any]]]
+) -> Dict[str, int]:
+    """
+    Public API for multi-patient streaming sync to knowledge graph
+
+    Args:
+        patients: Patient demographics (each with "id")
+        fact_batches: Batches of fact column mappings, each with "patient_id"
+
+    Returns:
+        Sync statistics
+    """
+    return neo4j_service.sync_patients_to_graph_bulk(patients, fact_batches)
+
+
+def sync_patient_facts_to_graph_csv(
+    patient_id: int,
+    patient_data: Dict[str, Any],
+    facts: Iterable[Dict[str, Any]]
+) -> Dict[str, int]:
+    """
+    Public API for LOAD CSV patient sync (very large patients)
+
+    Args:
+        patient_id: PostgreSQL patient ID
+        patient_data: Patient demographics
+        facts: Fact column mappings, streamed
+
+    Returns:
+        Sync statistics
+    """
+    return neo4j_service.sync_patient_to_graph_csv(
+        patient_id, patient_data, facts, settings.neo4j_import_dir
+    )
+
+
 def query_knowledge_graph(cypher: str, params: Dict = None) -> List[Dict]:
     """
     Public API for querying the knowledge graph
@@ -3,17 +3,23 @@ NeuroscribeAI - Vector Search Service
 Semantic similarity search using pgvector and sentence-transformers
 """
 
+import csv
+import io
 import logging
 import numpy as np
 from typing import List, Dict, Optional, Any, Tuple
 from sentence_transformers import SentenceTransformer
-from sqlalchemy import create_engine, text as sql_text
+from sqlalchemy import create_engine, event, text as sql_text
 from sqlalchemy.orm import sessionmaker
+from pgvector.psycopg2 import register_vector
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Reciprocal Rank Fusion constant used by hybrid search
+RRF_K = 60
+
 
 # =============================================================================
 # Vector Search Service
@@ -52,6 +58,13 @@ class VectorSearchService:
             # Use sync connection for vector queries (pgvector doesn't support async yet)
             db_url = settings.get_database_url(for_alembic=True)
             self.engine = create_engine(db_url, pool_pre_ping=True)
+
+            # Register the pgvector adapter on every pooled connection so
+            # vector columns come back as numpy arrays instead of text
+            @event.listens_for(self.engine, "connect")
+            def _register_vector(dbapi_connection, connection_record):
+                register_vector(dbapi_connection)
+
             self.Session = sessionmaker(bind=self.engine)
             logger.info("✓ Vector search database connection initialized")
         except Exception as e:
@@ -62,7 +75,7 @@ class VectorSearchService:
     # Embedding Generation
     # =========================================================================
 
-    def generate_embedding(self, text: str) -> List[float]:
+    def generate_embedding(self, text: str) -> np.ndarray:
         """
         Generate embedding vector for text
 
@@ -70,7 +83,7 @@ class VectorSearchService:
             text: Input text (will be truncated to model max length)
 
         Returns:
-            384-dimensional embedding vector
+            384-dimensional float32 embedding vector
         """
         if not self.model:
             raise RuntimeError("Embedding model not initialized")
@@ -84,14 +97,14 @@ class VectorSearchService:
                 normalize_embeddings=True  # L2 normalization for better cosine similarity
             )
 
-            return embedding.tolist()
+            return embedding.astype(np.float32, copy=False)
 
         except Exception as e:
             logger.error(f"Embedding generation failed: {e}")
             raise
 
-    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts (more efficient)"""
+    def generate_embeddings_batch(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for multiple texts (more efficient), one float32 row per text"""
         if not self.model:
             raise RuntimeError("Embedding model not initialized")
 
@@ -104,7 +117,7 @@ class VectorSearchService:
                 batch_size=32
             )
 
-            return embeddings.tolist()
+            return embeddings.astype(np.float32, copy=False)
 
         except Exception as e:
             logger.error(f"Batch embedding generation failed: {e}")
@@ -198,37 +211,71 @@ class VectorSearchService:
         """
         with self.Session() as session:
             try:
-                # Clear existing chunks for this document
+                # Serialize chunks as CSV for COPY (csv handles quoting of
+                # newlines and delimiters inside chunk text)
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                for chunk in chunks_with_embeddings:
+                    embedding = np.asarray(chunk["embedding"], dtype=np.float32)
+                    writer.writerow([
+                        chunk["chunk_index"],
+                        chunk["chunk_text"],
+                        chunk["char_start"],
+                        chunk["char_end"],
+                        "[" + ",".join(map(str, embedding.tolist())) + "]",
+                        chunk["token_count"]
+                    ])
+                buffer.seek(0)
+
+                # COPY into a transaction-scoped staging table
+                session.execute(sql_text("""
+                    CREATE TEMP TABLE document_chunks_stage (
+                        chunk_index INTEGER,
+                        chunk_text TEXT,
+                        char_start INTEGER,
+                        char_end INTEGER,
+                        embedding vector(384),
+                        token_count INTEGER
+                    ) ON COMMIT DROP
+                """))
+                with session.connection().connection.cursor() as cursor:
+                    cursor.copy_expert(
+                        "COPY document_chunks_stage (chunk_index, chunk_text, char_start, "
+                        "char_end, embedding, token_count) FROM STDIN WITH (FORMAT csv)",
+                        buffer
+                    )
+
+                # Upsert instead of DELETE + INSERT so first-time indexing
+                # doesn't touch the vector index for rows that don't exist
                 session.execute(
-                    sql_text("DELETE FROM document_chunks WHERE document_id = :doc_id"),
+                    sql_text("""
+                        INSERT INTO document_chunks (
+                            document_id, chunk_index, chunk_text,
+                            char_start, char_end, embedding, token_count
+                        )
+                        SELECT
+                            :doc_id, chunk_index, chunk_text,
+                            char_start, char_end, embedding, token_count
+                        FROM document_chunks_stage
+                        ON CONFLICT (document_id, chunk_index) DO UPDATE SET
+                            chunk_text = EXCLUDED.chunk_text,
+                            char_start = EXCLUDED.char_start,
+                            char_end = EXCLUDED.char_end,
+                            embedding = EXCLUDED.embedding,
+                            token_count = EXCLUDED.token_count,
+                            updated_at = now()
+                    """),
                     {"doc_id": document_id}
                 )
 
-                # Insert new chunks
-                for chunk in chunks_with_embeddings:
-                    session.execute(
-                        sql_text("""
-                            INSERT INTO document_chunks (
-                                document_id, chunk_index, chunk_text,
-                                char_start, char_end, embedding, token_count,
-                                contains_clinical_entities
-                            ) VALUES (
-                                :doc_id, :chunk_idx, :text,
-                                :start, :end, :embedding::vector, :tokens,
-                                :has_entities
-                            )
-                        """),
-                        {
-                            "doc_id": document_id,
-                            "chunk_idx": chunk["chunk_index"],
-                            "text": chunk["chunk_text"],
-                            "start": chunk["char_start"],
-                            "end": chunk["char_end"],
-                            "embedding": str(chunk["embedding"]),
-                            "tokens": chunk["token_count"],
-                            "has_entities": True  # Will be updated by fact extraction
-                        }
-                    )
+                # Drop trailing chunks left over from a longer previous version
+                session.execute(
+                    sql_text("""
+                        DELETE FROM document_chunks
+                        WHERE document_id = :doc_id AND chunk_index >= :chunk_count
+                    """),
+                    {"doc_id": document_id, "chunk_count": len(chunks_with_embeddings)}
+                )
 
                 session.commit()
                 logger.info(f"✓ Stored {len(chunks_with_embeddings)} chunks for document {document_id}")
@@ -262,11 +309,29 @@ class VectorSearchService:
         Returns:
             List of matching chunks with similarity scores
         """
-        threshold = similarity_threshold or settings.vector_similarity_threshold
-
         # Generate query embedding
         query_embedding = self.generate_embedding(query)
 
+        results = self._semantic_search_vec(
+            query_embedding,
+            top_k=top_k,
+            similarity_threshold=similarity_threshold,
+            document_id=document_id
+        )
+
+        logger.info(f"Semantic search found {len(results)} results for query: '{query[:50]}...'")
+        return results
+
+    def _semantic_search_vec(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 10,
+        similarity_threshold: float = None,
+        document_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Nearest-neighbour chunk search for a precomputed query embedding"""
+        threshold = similarity_threshold or settings.vector_similarity_threshold
+
         with self.Session() as session:
             # Build query
             sql_query = """
@@ -278,7 +343,7 @@ class VectorSearchService:
                     dc.section_name,
                     dc.char_start,
                     dc.char_end,
-                    1 - (dc.embedding <=> :query_embedding::vector) as similarity_score,
+                    1 - (dc.embedding <=> :query_embedding) as similarity_score,
                     d.title as document_title,
                     d.document_type,
                     d.patient_id
@@ -287,7 +352,7 @@ class VectorSearchService:
                 WHERE dc.embedding IS NOT NULL
             """
 
-            params = {"query_embedding": str(query_embedding)}
+            params = {"query_embedding": query_embedding}
 
             # Add document filter if specified
             if document_id:
@@ -295,11 +360,11 @@ class VectorSearchService:
                 params["doc_id"] = document_id
 
             # Add similarity threshold
-            sql_query += " AND (1 - (dc.embedding <=> :query_embedding::vector)) >= :threshold"
+            sql_query += " AND (1 - (dc.embedding <=> :query_embedding)) >= :threshold"
             params["threshold"] = threshold
 
             # Order and limit
-            sql_query += " ORDER BY dc.embedding <=> :query_embedding::vector LIMIT :limit"
+            sql_query += " ORDER BY dc.embedding <=> :query_embedding LIMIT :limit"
             params["limit"] = top_k
 
             # Execute query
@@ -320,7 +385,6 @@ class VectorSearchService:
                     "char_end": row.char_end
                 })
 
-            logger.info(f"Semantic search found {len(results)} results for query: '{query[:50]}...'")
             return results
 
     def find_similar_documents(
@@ -341,50 +405,41 @@ class VectorSearchService:
             List of similar documents with scores
         """
         with self.Session() as session:
-            # Get all chunks for source document
-            chunks = session.execute(
-                sql_text("SELECT embedding FROM document_chunks WHERE document_id = :doc_id AND embedding IS NOT NULL"),
+            # Get precomputed profile vector for source document
+            source = session.execute(
+                sql_text("SELECT patient_id, profile_embedding FROM documents WHERE id = :doc_id"),
                 {"doc_id": document_id}
-            ).fetchall()
+            ).fetchone()
 
-            if not chunks:
+            if source is None or source.profile_embedding is None:
                 logger.warning(f"No embeddings found for document {document_id}")
                 return []
 
-            # Average embeddings to get document vector
-            embeddings = [np.array(eval(row.embedding)) for row in chunks]
-            doc_embedding = np.mean(embeddings, axis=0).tolist()
-
-            # Search for similar chunks
+            # Compare profile vectors directly (served by the HNSW index)
             sql_query = """
-                SELECT DISTINCT
-                    dc.document_id,
+                SELECT
+                    d.id as document_id,
                     d.title,
                     d.document_type,
                     d.patient_id,
-                    AVG(1 - (dc.embedding <=> :doc_embedding::vector)) as avg_similarity
-                FROM document_chunks dc
-                JOIN documents d ON dc.document_id = d.id
-                WHERE dc.document_id != :source_doc_id
-                  AND dc.embedding IS NOT NULL
+                    1 - (d.profile_embedding <=> :doc_embedding) as avg_similarity
+                FROM documents d
+                WHERE d.id != :source_doc_id
+                  AND d.profile_embedding IS NOT NULL
+                  AND (1 - (d.profile_embedding <=> :doc_embedding)) >= :threshold
             """
 
             params = {
-                "doc_embedding": str(doc_embedding),
+                "doc_embedding": source.profile_embedding,
                 "source_doc_id": document_id
             }
 
             if exclude_same_patient:
-                sql_query += """
-                  AND d.patient_id NOT IN (
-                      SELECT patient_id FROM documents WHERE id = :source_doc_id
-                  )
-                """
+                sql_query += " AND d.patient_id != :source_patient_id"
+                params["source_patient_id"] = source.patient_id
 
             sql_query += """
-                GROUP BY dc.document_id, d.title, d.document_type, d.patient_id
-                HAVING AVG(1 - (dc.embedding <=> :doc_embedding::vector)) >= :threshold
-                ORDER BY avg_similarity DESC
+                ORDER BY d.profile_embedding <=> :doc_embedding
                 LIMIT :limit
             """
 
@@ -422,51 +477,41 @@ class VectorSearchService:
             List of similar patients with similarity scores
         """
         with self.Session() as session:
-            # Get all document chunks for patient
-            chunks = session.execute(
-                sql_text("""
-                    SELECT dc.embedding
-                    FROM document_chunks dc
-                    JOIN documents d ON dc.document_id = d.id
-                    WHERE d.patient_id = :patient_id
-                      AND dc.embedding IS NOT NULL
-                """),
+            # Get precomputed patient profile vector (average of all chunks)
+            patient_profile = session.execute(
+                sql_text("SELECT profile_embedding FROM patients WHERE id = :patient_id"),
                 {"patient_id": patient_id}
-            ).fetchall()
+            ).scalar()
 
-            if not chunks:
+            if patient_profile is None:
                 logger.warning(f"No embeddings found for patient {patient_id}")
                 return []
 
-            # Create patient profile vector (average of all chunks)
-            embeddings = [np.array(eval(row.embedding)) for row in chunks]
-            patient_profile = np.mean(embeddings, axis=0).tolist()
-
             # Find similar patients
             sql_query = """
                 SELECT
-                    d.patient_id,
+                    p.id as patient_id,
                     p.mrn,
                     p.age,
                     p.sex,
                     p.primary_diagnosis,
-                    AVG(1 - (dc.embedding <=> :profile::vector)) as similarity_score,
-                    COUNT(DISTINCT d.id) as document_count
-                FROM document_chunks dc
-                JOIN documents d ON dc.document_id = d.id
-                JOIN patients p ON d.patient_id = p.id
-                WHERE d.patient_id != :source_patient_id
-                  AND dc.embedding IS NOT NULL
-                GROUP BY d.patient_id, p.mrn, p.age, p.sex, p.primary_diagnosis
-                HAVING AVG(1 - (dc.embedding <=> :profile::vector)) >= :threshold
-                ORDER BY similarity_score DESC
+                    1 - (p.profile_embedding <=> :profile) as similarity_score,
+                    (
+                        SELECT COUNT(*) FROM documents d
+                        WHERE d.patient_id = p.id AND d.profile_embedding IS NOT NULL
+                    ) as document_count
+                FROM patients p
+                WHERE p.id != :source_patient_id
+                  AND p.profile_embedding IS NOT NULL
+                  AND (1 - (p.profile_embedding <=> :profile)) >= :threshold
+                ORDER BY p.profile_embedding <=> :profile
                 LIMIT :limit
             """
 
             result = session.execute(
                 sql_text(sql_query),
                 {
-                    "profile": str(patient_profile),
+                    "profile": patient_profile,
                     "source_patient_id": patient_id,
                     "threshold": settings.vector_similarity_threshold,
                     "limit": top_k
@@ -503,11 +548,21 @@ class VectorSearchService:
         Returns:
             Matching documents/patients
         """
-        # Combine features into query
-        query_text = " ".join(features)
+        if not features:
+            return []
+
+        # Embed each feature separately (a joined string may be truncated by
+        # the model) and search with the re-normalized mean vector
+        feature_embeddings = self.generate_embeddings_batch(features)
+        query_embedding = feature_embeddings.mean(axis=0)
+        norm = np.linalg.norm(query_embedding)
+        if norm > 0:
+            query_embedding /= norm
+
+        results = self._semantic_search_vec(query_embedding, top_k=top_k)
 
-        # Use semantic search
-        return self.semantic_search(query_text, top_k=top_k)
+        logger.info(f"Feature search found {len(results)} results for {len(features)} features")
+        return results
 
     # =========================================================================
     # Advanced Search Methods
@@ -530,24 +585,103 @@ class VectorSearchService:
         Returns:
             Hybrid ranked results
         """
-        # Get semantic results
-        semantic_results = self.semantic_search(query, top_k=top_k * 2)
-
-        # If keywords provided, boost scores for keyword matches
-        if keywords:
-            for result in semantic_results:
-                keyword_matches = sum(
-                    1 for kw in keywords
-                    if kw.lower() in result["chunk_text"].lower()
+        # Without keywords this is a plain semantic search
+        if not keywords:
+            return self.semantic_search(query, top_k=top_k)
+
+        query_embedding = self.generate_embedding(query)
+
+        # websearch_to_tsquery never raises on user input; quote each keyword
+        # so multi-word keywords are matched as phrases
+        phrases = [kw.replace('"', " ").strip() for kw in keywords]
+        phrases = [phrase for phrase in phrases if phrase]
+        keyword_query = " OR ".join(f'"{phrase}"' for phrase in phrases)
+
+        with self.Session() as session:
+            # Rank candidates separately by vector distance and by full-text
+            # relevance, then fuse both rankings server-side with Reciprocal
+            # Rank Fusion: score = sum(1 / (k + rank))
+            sql_query = """
+                WITH semantic AS (
+                    SELECT
+                        dc.id,
+                        ROW_NUMBER() OVER (ORDER BY dc.embedding <=> :query_embedding) AS rank
+                    FROM document_chunks dc
+                    WHERE dc.embedding IS NOT NULL
+                      AND (1 - (dc.embedding <=> :query_embedding)) >= :threshold
+                    ORDER BY dc.embedding <=> :query_embedding
+                    LIMIT :candidates
+                ),
+                keyword AS (
+                    SELECT
+                        dc.id,
+                        ts_rank_cd(dc.content_tsv, kwq) AS kw_rank,
+                        ROW_NUMBER() OVER (ORDER BY ts_rank_cd(dc.content_tsv, kwq) DESC) AS rank
+                    FROM document_chunks dc, websearch_to_tsquery('english', :kwq) kwq
+                    WHERE dc.content_tsv @@ kwq
+                    ORDER BY kw_rank DESC
+                    LIMIT :candidates
                 )
-                # Boost score by 10% per keyword match
-                result["similarity_score"] *= (1 + 0.1 * keyword_matches)
-                result["keyword_matches"] = keyword_matches
+                SELECT
+                    dc.id,
+                    dc.document_id,
+                    dc.chunk_index,
+                    dc.chunk_text,
+                    dc.section_name,
+                    dc.char_start,
+                    dc.char_end,
+                    1 - (dc.embedding <=> :query_embedding) as similarity_score,
+                    keyword.kw_rank,
+                    (
+                        SELECT COUNT(*)
+                        FROM unnest(CAST(:keywords AS text[])) AS kw
+                        WHERE dc.content_tsv @@ phraseto_tsquery('english', kw)
+                    ) as keyword_matches,
+                    COALESCE(1.0 / (:rrf_k + semantic.rank), 0.0)
+                        + COALESCE(1.0 / (:rrf_k + keyword.rank), 0.0) as hybrid_score,
+                    d.title as document_title,
+                    d.document_type,
+                    d.patient_id
+                FROM semantic
+                FULL OUTER JOIN keyword ON semantic.id = keyword.id
+                JOIN document_chunks dc ON dc.id = COALESCE(semantic.id, keyword.id)
+                JOIN documents d ON dc.document_id = d.id
+                ORDER BY hybrid_score DESC
+                LIMIT :limit
+            """
 
-            # Re-sort by boosted scores
-            semantic_results.sort(key=lambda x: x["similarity_score"], reverse=True)
+            params = {
+                "query_embedding": query_embedding,
+                "kwq": keyword_query,
+                "keywords": phrases,
+                "threshold": settings.vector_similarity_threshold,
+                "candidates": top_k * 2,
+                "rrf_k": RRF_K,
+                "limit": top_k
+            }
 
-        return semantic_results[:top_k]
+            result = session.execute(sql_text(sql_query), params)
+
+            results = []
+            for row in result:
+                results.append({
+                    "chunk_id": row.id,
+                    "document_id": row.document_id,
+                    "patient_id": row.patient_id,
+                    "chunk_text": row.chunk_text,
+                    "section_name": row.section_name,
+                    "document_title": row.document_title,
+                    "document_type": row.document_type,
+                    "similarity_score": float(row.similarity_score),
+                    "keyword_rank": float(row.kw_rank) if row.kw_rank is not None else None,
+                    "keyword_matches": row.keyword_matches,
+                    "hybrid_score": float(row.hybrid_score),
+                    "char_start": row.char_start,
+                    "char_end": row.char_end
+                })
+
+            logger.info(f"Hybrid search found {len(results)} results for query: '{query[:50]}...'")
+            return results
 
     def find_evidence_for_fact(
         self,
@@ -575,20 +709,20 @@ class VectorSearchService:
                     dc.document_id,
                     d.document_type,
                     d.patient_id,
-                    1 - (dc.embedding <=> :embedding::vector) as similarity
+                    1 - (dc.embedding <=> :embedding) as similarity
                 FROM document_chunks dc
                 JOIN documents d ON dc.document_id = d.id
                 WHERE dc.embedding IS NOT NULL
             """
 
-            params = {"embedding": str(embedding)}
+            params = {"embedding": embedding}
 
             if patient_id:
                 sql_query += " AND d.patient_id = :patient_id"
                 params["patient_id"] = patient_id
 
             sql_query += """
-                ORDER BY dc.embedding <=> :embedding::vector
+                ORDER BY dc.embedding <=> :embedding
                 LIMIT :limit
             """
             params["limit"] = top_k
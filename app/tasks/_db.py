@@ -0,0 +1,128 @@
+"""
+NeuroscribeAI - Task Database Access
+Shared SQLAlchemy engine and session factory for Celery tasks
+"""
+
+import io
+import json
+from functools import lru_cache
+from typing import Any, Dict, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from app.config import settings
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Get the process-wide database engine (one connection pool per worker process)"""
+    return create_engine(
+        settings.get_database_url(for_alembic=True),
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        echo=settings.database_echo
+    )
+
+
+# Thread-local sessions bound to the shared engine
+SessionLocal = scoped_session(sessionmaker(bind=get_engine(), expire_on_commit=False))
+
+
+# Columns written by bulk_insert_facts (NOT NULL flags without a server
+# default are written explicitly)
+FACT_COPY_COLUMNS = [
+    "patient_id", "document_id", "entity_type", "entity_name",
+    "extracted_text", "source_snippet", "confidence_score", "extraction_method",
+    "timestamp", "resolved_timestamp",
+    "is_negated", "is_historical", "is_hypothetical",
+    "anatomical_context", "medication_detail", "imaging_detail",
+    "procedure_detail", "lab_value", "neuro_exam_detail", "temporal_context",
+    "char_start", "char_end",
+    "verified", "nli_verified", "synced_to_neo4j",
+]
+FACT_JSON_COLUMNS = {
+    "anatomical_context", "medication_detail", "imaging_detail",
+    "procedure_detail", "lab_value", "neuro_exam_detail", "temporal_context",
+}
+FACT_FLAG_COLUMNS = {
+    "is_negated", "is_historical", "is_hypothetical",
+    "verified", "nli_verified", "synced_to_neo4j",
+}
+COPY_NULL = "\\N"
+
+
+def _copy_csv_field(value: Any) -> str:
+    """
+    Encode one value for COPY ... (FORMAT csv, NULL '\\N')
+
+    NULL is the bare marker; every other value is quoted, so text that
+    happens to equal the marker (or contains quotes, commas or newlines)
+    is never read back as NULL.
+    """
+    if value is None:
+        return COPY_NULL
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def build_fact_copy_csv(rows: List[Dict[str, Any]]) -> str:
+    """
+    Render fact rows as COPY CSV in FACT_COPY_COLUMNS order
+
+    Args:
+        rows: Fact dictionaries (model_dump(mode="json")) with patient_id and document_id set
+
+    Returns:
+        CSV text, one line per fact
+    """
+    lines = []
+    for row in rows:
+        values = []
+        for column in FACT_COPY_COLUMNS:
+            value = row.get(column)
+            if value is None and column in FACT_FLAG_COLUMNS:
+                value = False
+            if value is not None and column in FACT_JSON_COLUMNS:
+                value = json.dumps(value)
+            values.append(_copy_csv_field(value))
+        lines.append(",".join(values) + "\n")
+    return "".join(lines)
+
+
+def bulk_insert_facts(rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert extracted facts with a single COPY
+
+    Args:
+        rows: Fact dictionaries (as returned by extract_facts, i.e.
+            model_dump(mode="json")) with patient_id and document_id set
+
+    Returns:
+        Number of facts inserted
+    """
+    if not rows:
+        return 0
+
+    # Insert in (patient_id, entity_type) order so idx_fact_patient_type
+    # and the patient_id index are filled on adjacent leaf pages
+    rows = sorted(rows, key=lambda r: (r["patient_id"], str(r["entity_type"])))
+
+    buffer = io.StringIO(build_fact_copy_csv(rows))
+
+    connection = get_engine().raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY atomic_clinical_facts ({', '.join(FACT_COPY_COLUMNS)}) "
+                f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+                buffer
+            )
+        connection.commit()
+    finally:
+        connection.close()
+
+    return len(rows)
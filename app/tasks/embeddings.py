@@ -5,7 +5,7 @@ Celery tasks for document indexing and vector embedding generation
 
 import logging
 from typing import Dict
-from app.celery_app import celery_app
+from app.celery_app import celery_app, retry_countdown
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +40,7 @@ def generate_document_embeddings_task(self, document_id: int, text: str) -> dict
 
     except Exception as e:
         logger.error(f"Embedding generation task failed: {e}", exc_info=True)
-        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
+        raise self.retry(exc=e, countdown=retry_countdown(self.request.retries))
 
 
 @celery_app.task(name="app.tasks.embeddings.batch_index_documents")
@@ -93,15 +93,10 @@ def reindex_all_documents_task() -> dict:
         logger.info("Starting full document reindexing")
 
         # Get all documents from database
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-        from app.config import settings
+        from app.tasks._db import SessionLocal
         from app.models import Document
 
-        engine = create_engine(settings.get_database_url(for_alembic=True))
-        Session = sessionmaker(bind=engine)
-
-        with Session() as session:
+        with SessionLocal() as session:
             documents = session.query(Document).filter(
                 Document.content.isnot(None)
             ).all()
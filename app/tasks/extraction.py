@@ -5,8 +5,10 @@ Celery tasks for asynchronous clinical fact extraction
 
 import logging
 from typing import List
-from app.celery_app import celery_app
-from app.modules.extraction import extract_clinical_facts
+from app.celery_app import celery_app, retry_countdown
+from app.modules.extraction import (
+    extract_clinical_facts, extract_clinical_facts_batch, NER_PIPE_BATCH_SIZE
+)
 from app.schemas import AtomicClinicalFact
 
 logger = logging.getLogger(__name__)
@@ -31,8 +33,8 @@ def extract_facts_task(self, text: str, patient_id: int, document_id: int) -> Li
         # Extract facts
         facts = extract_clinical_facts(text, patient_id, document_id)
 
-        # Convert to dictionaries for JSON serialization
-        facts_dict = [fact.dict() for fact in facts]
+        # Convert to primitives for msgpack serialization
+        facts_dict = [fact.model_dump(mode="json") for fact in facts]
 
         logger.info(f"Extraction complete: {len(facts_dict)} facts extracted")
         return facts_dict
@@ -40,33 +42,70 @@ def extract_facts_task(self, text: str, patient_id: int, document_id: int) -> Li
     except Exception as e:
         logger.error(f"Extraction failed: {e}", exc_info=True)
         # Retry with exponential backoff
-        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
+        raise self.retry(exc=e, countdown=retry_countdown(self.request.retries))
 
 
-@celery_app.task(name="app.tasks.extraction.batch_extract")
-def batch_extract_task(documents: List[dict]) -> List[dict]:
+@celery_app.task(name="app.tasks.extraction.persist_facts", bind=True, max_retries=3)
+def persist_facts_task(self, facts: List[dict], patient_id: int, document_id: int) -> dict:
     """
-    Batch extraction for multiple documents
+    Save facts forwarded in a chain to PostgreSQL
+
+    Args:
+        facts: Fact dictionaries returned by extract_facts
+        patient_id: Patient ID
+        document_id: Document ID
+
+    Returns:
+        Document ID and number of facts inserted
+    """
+    try:
+        from app.tasks._db import bulk_insert_facts
+
+        # Extracted facts carry no ids; stamp them for the fact rows
+        rows = [{**fact, "patient_id": patient_id, "document_id": document_id} for fact in facts]
+        inserted = bulk_insert_facts(rows)
+
+        logger.info(f"✓ Persisted {inserted} facts for document {document_id}")
+        return {
+            "document_id": document_id,
+            "facts_inserted": inserted
+        }
+
+    except Exception as e:
+        logger.error(f"Persisting facts failed: {e}", exc_info=True)
+        raise self.retry(exc=e, countdown=retry_countdown(self.request.retries))
+
+
+@celery_app.task(name="app.tasks.extraction.extract_facts_batch")
+def extract_facts_batch_task(documents: List[dict]) -> List[dict]:
+    """
+    Extract clinical facts from a chunk of documents with one nlp.pipe pass
+
+    Failures are recorded per document instead of raised, so one bad
+    document cannot fail the whole batch chord. If the batched pass fails,
+    the chunk falls back to per-document extraction to isolate the culprit.
 
     Args:
         documents: List of documents with text, patient_id, document_id
 
     Returns:
-        List of extraction results
+        Extraction results, one per document in input order
     """
+    logger.info(f"Starting batched extraction for {len(documents)} documents")
+
+    try:
+        return [
+            _success_result(doc, facts)
+            for doc, facts in zip(documents, extract_clinical_facts_batch(documents))
+        ]
+    except Exception as e:
+        logger.warning(f"Batched extraction failed, retrying per document: {e}")
+
     results = []
     for doc in documents:
         try:
-            facts = extract_clinical_facts(
-                doc["text"],
-                doc["patient_id"],
-                doc["document_id"]
-            )
-            results.append({
-                "document_id": doc["document_id"],
-                "facts": [f.dict() for f in facts],
-                "status": "success"
-            })
+            facts = extract_clinical_facts(doc["text"], doc["patient_id"], doc["document_id"])
+            results.append(_success_result(doc, facts))
         except Exception as e:
             logger.error(f"Batch extraction failed for doc {doc.get('document_id')}: {e}")
             results.append({
@@ -76,3 +115,59 @@ def batch_extract_task(documents: List[dict]) -> List[dict]:
             })
 
     return results
+
+
+def _success_result(doc: dict, facts: List[AtomicClinicalFact]) -> dict:
+    """Batch result entry for a successfully extracted document"""
+    return {
+        "document_id": doc["document_id"],
+        "facts": [fact.model_dump(mode="json") for fact in facts],
+        "status": "success"
+    }
+
+
+@celery_app.task(name="app.tasks.extraction.batch_extract", bind=True)
+def batch_extract_task(self, documents: List[dict]) -> List[dict]:
+    """
+    Batch extraction for multiple documents
+
+    Documents are split into NER_PIPE_BATCH_SIZE chunks, each extracted by
+    its own extract_facts_batch task so the batch fans out across workers
+    while NER still runs batched; a chord callback aggregates the results.
+
+    Args:
+        documents: List of documents with text, patient_id, document_id
+
+    Returns:
+        List of extraction results
+    """
+    if not documents:
+        return []
+
+    from celery import chord, group
+
+    header = group(
+        extract_facts_batch_task.s(documents[i:i + NER_PIPE_BATCH_SIZE])
+        for i in range(0, len(documents), NER_PIPE_BATCH_SIZE)
+    )
+
+    # This task's result becomes the chord callback's result
+    return self.replace(chord(header, _aggregate_batch.s()))
+
+
+@celery_app.task(name="app.tasks.extraction.aggregate_batch")
+def _aggregate_batch(results: List[List[dict]]) -> List[dict]:
+    """
+    Chord callback: flatten per-chunk results into one list
+
+    Args:
+        results: Per-chunk results from extract_facts_batch, in header order
+
+    Returns:
+        List of extraction results
+    """
+    batch_results = [result for chunk in results for result in chunk]
+
+    failed = sum(1 for result in batch_results if result["status"] == "failed")
+    logger.info(f"Batch extraction complete: {len(batch_results)} documents, {failed} failed")
+    return batch_results
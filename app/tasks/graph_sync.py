@@ -5,11 +5,31 @@ Celery tasks for syncing clinical facts to Neo4j knowledge graph
 
 import logging
 from typing import List, Dict
-from app.celery_app import celery_app
+from app.celery_app import celery_app, retry_countdown
 
 logger = logging.getLogger(__name__)
 
 
+def _graph_fact_columns() -> list:
+    """Fact columns the graph sync needs"""
+    from app.models import AtomicClinicalFact as FactModel
+
+    return [
+        FactModel.id,
+        FactModel.patient_id,
+        FactModel.entity_type,
+        FactModel.entity_name,
+        FactModel.extracted_text,
+        FactModel.confidence_score,
+        FactModel.extraction_method,
+        FactModel.anatomical_context,
+        FactModel.medication_detail,
+        FactModel.temporal_context,
+        FactModel.is_negated,
+        FactModel.is_historical
+    ]
+
+
 @celery_app.task(name="app.tasks.graph_sync.sync_patient_to_graph", bind=True, max_retries=3)
 def sync_patient_to_graph_task(self, patient_id: int) -> dict:
     """
@@ -25,15 +45,16 @@ def sync_patient_to_graph_task(self, patient_id: int) -> dict:
         logger.info(f"Starting graph sync for patient {patient_id}")
 
         # Get patient data and facts from database
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy import select, func
         from app.config import settings
+        from app.tasks._db import SessionLocal
         from app.models import Patient, AtomicClinicalFact as FactModel
+        from app.services.neo4j_service import (
+            sync_patient_facts_to_graph_bulk, sync_patient_facts_to_graph_csv,
+            GRAPH_SYNC_BATCH_SIZE
+        )
 
-        engine = create_engine(settings.get_database_url(for_alembic=True))
-        Session = sessionmaker(bind=engine)
-
-        with Session() as session:
+        with SessionLocal() as session:
             # Get patient
             patient = session.query(Patient).filter(Patient.id == patient_id).first()
             if not patient:
@@ -48,33 +69,29 @@ def sync_patient_to_graph_task(self, patient_id: int) -> dict:
                 "updated_at": patient.updated_at
             }
 
-            # Get all facts
-            facts_db = session.query(FactModel).filter(
-                FactModel.patient_id == patient_id
-            ).all()
-
-        # Convert to schema objects
-        from app.schemas import AtomicClinicalFact
-        facts = [
-            AtomicClinicalFact(
-                entity_type=f.entity_type,
-                entity_name=f.entity_name,
-                extracted_text=f.extracted_text,
-                source_snippet=f.source_snippet,
-                confidence_score=f.confidence_score,
-                extraction_method=f.extraction_method,
-                anatomical_context=f.anatomical_context,
-                medication_detail=f.medication_detail,
-                temporal_context=f.temporal_context,
-                is_negated=f.is_negated,
-                is_historical=f.is_historical
+            fact_count = session.execute(
+                select(func.count()).select_from(FactModel).where(FactModel.patient_id == patient_id)
+            ).scalar_one()
+
+            # Stream only the columns the graph needs (server-side cursor)
+            result = session.execute(
+                select(*_graph_fact_columns())
+                .where(FactModel.patient_id == patient_id)
+                .execution_options(stream_results=True, yield_per=GRAPH_SYNC_BATCH_SIZE)
             )
-            for f in facts_db
-        ]
 
-        # Sync to Neo4j
-        from app.services.neo4j_service import sync_patient_facts_to_graph
-        stats = sync_patient_facts_to_graph(patient_id, patient_data, facts)
+            # Sync to Neo4j: LOAD CSV for very large patients, otherwise
+            # each partition is sent as one UNWIND batch
+            threshold = settings.graph_sync_csv_threshold
+            if threshold and fact_count > threshold:
+                logger.info(f"Patient {patient_id} has {fact_count} facts, syncing via LOAD CSV")
+                stats = sync_patient_facts_to_graph_csv(
+                    patient_id, patient_data, result.mappings()
+                )
+            else:
+                stats = sync_patient_facts_to_graph_bulk(
+                    patient_id, patient_data, result.mappings().partitions()
+                )
 
         logger.info(f"✓ Graph sync complete: {stats['nodes_created']} nodes, "
                    f"{stats['relationships_created']} relationships")
@@ -87,14 +104,17 @@ def sync_patient_to_graph_task(self, patient_id: int) -> dict:
 
     except Exception as e:
         logger.error(f"Graph sync task failed: {e}", exc_info=True)
-        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
+        raise self.retry(exc=e, countdown=retry_countdown(self.request.retries))
 
 
-@celery_app.task(name="app.tasks.graph_sync.batch_sync_patients")
-def batch_sync_patients_task(patient_ids: List[int]) -> Dict:
+@celery_app.task(name="app.tasks.graph_sync.batch_sync_patients", bind=True, max_retries=3)
+def batch_sync_patients_task(self, patient_ids: List[int]) -> Dict:
     """
     Batch sync multiple patients to graph
 
+    Runs as one streaming job: a single Postgres cursor over all patients'
+    facts (ordered by patient) feeds one pipelined UNWIND stream to Neo4j.
+
     Args:
         patient_ids: List of patient IDs
 
@@ -107,18 +127,59 @@ def batch_sync_patients_task(patient_ids: List[int]) -> Dict:
         "failed": 0,
         "errors": []
     }
+    if not patient_ids:
+        return results
+
+    try:
+        logger.info(f"Starting batch graph sync for {len(patient_ids)} patients")
 
-    for patient_id in patient_ids:
-        try:
-            sync_patient_to_graph_task(patient_id)
-            results["successful"] += 1
-        except Exception as e:
-            logger.error(f"Failed to sync patient {patient_id}: {e}")
-            results["failed"] += 1
-            results["errors"].append({
-                "patient_id": patient_id,
-                "error": str(e)
-            })
-
-    logger.info(f"Batch sync complete: {results['successful']}/{results['total']} successful")
-    return results
+        from sqlalchemy import select
+        from app.tasks._db import SessionLocal
+        from app.models import Patient, AtomicClinicalFact as FactModel
+        from app.services.neo4j_service import (
+            sync_patients_facts_to_graph_bulk, GRAPH_SYNC_BATCH_SIZE
+        )
+
+        with SessionLocal() as session:
+            patients = [
+                dict(row)
+                for row in session.execute(
+                    select(
+                        Patient.id,
+                        Patient.mrn,
+                        Patient.age,
+                        Patient.sex,
+                        Patient.primary_diagnosis,
+                        Patient.updated_at
+                    ).where(Patient.id.in_(patient_ids))
+                ).mappings()
+            ]
+            found_ids = {p["id"] for p in patients}
+
+            # One index range scan across all patients, streamed
+            result = session.execute(
+                select(*_graph_fact_columns())
+                .where(FactModel.patient_id.in_(found_ids))
+                .order_by(FactModel.patient_id)
+                .execution_options(stream_results=True, yield_per=GRAPH_SYNC_BATCH_SIZE)
+            )
+
+            stats = sync_patients_facts_to_graph_bulk(patients, result.mappings().partitions())
+
+        for patient_id in patient_ids:
+            if patient_id in found_ids:
+                results["successful"] += 1
+            else:
+                results["failed"] += 1
+                results["errors"].append({
+                    "patient_id": patient_id,
+                    "error": f"Patient {patient_id} not found"
+                })
+        results["stats"] = stats
+
+        logger.info(f"Batch sync complete: {results['successful']}/{results['total']} successful")
+        return results
+
+    except Exception as e:
+        logger.error(f"Batch graph sync task failed: {e}", exc_info=True)
+        raise self.retry(exc=e, countdown=retry_countdown(self.request.retries))
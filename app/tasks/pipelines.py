@@ -0,0 +1,36 @@
+"""
+NeuroscribeAI - Task Pipelines
+Celery canvas builders that chain ingestion tasks
+"""
+
+from celery import chain
+from celery.canvas import Signature
+
+from app.tasks.extraction import extract_facts_task, persist_facts_task
+from app.tasks.validation import validate_extracted_facts_task
+from app.tasks.graph_sync import sync_patient_to_graph_task
+
+
+def build_document_ingest_pipeline(text: str, patient_id: int, document_id: int) -> Signature:
+    """
+    Build the extract -> validate -> persist -> graph sync chain for one document
+
+    Extracted facts are forwarded in memory to validation, so it skips the
+    fact query, and then on to persist_facts, which saves them with one COPY.
+    Graph sync is immutable (.si) and reads the persisted facts, since graph
+    nodes are keyed by the PostgreSQL fact id.
+
+    Args:
+        text: Clinical text to extract from
+        patient_id: Patient ID
+        document_id: Document ID
+
+    Returns:
+        Chain signature (call .apply_async() or .delay() to run)
+    """
+    return chain(
+        extract_facts_task.s(text, patient_id, document_id),
+        validate_extracted_facts_task.s(patient_id=patient_id),
+        persist_facts_task.s(patient_id=patient_id, document_id=document_id),
+        sync_patient_to_graph_task.si(patient_id)
+    )
@@ -4,7 +4,7 @@ Celery tasks for asynchronous clinical summary generation
 """
 
 import logging
-from app.celery_app import celery_app
+from app.celery_app import celery_app, retry_countdown
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +25,12 @@ def generate_summary_task(self, patient_id: int, summary_type: str = "discharge_
         logger.info(f"Starting async summary generation: {summary_type} for patient {patient_id}")
 
         # Get all facts and alerts for patient from database
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-        from app.config import settings
+        from sqlalchemy import select
+        from app.tasks._db import SessionLocal
         from app.models import AtomicClinicalFact as FactModel, ClinicalAlert as AlertModel, Patient
+        from app.schemas import AtomicClinicalFact, ClinicalAlert, EntityType, SummaryRequest
 
-        engine = create_engine(settings.get_database_url(for_alembic=True))
-        Session = sessionmaker(bind=engine)
-
-        with Session() as session:
+        with SessionLocal() as session:
             # Get patient data
             patient = session.query(Patient).filter(Patient.id == patient_id).first()
             if not patient:
@@ -46,10 +43,33 @@ def generate_summary_task(self, patient_id: int, summary_type: str = "discharge_
                 "primary_diagnosis": patient.primary_diagnosis
             }
 
-            # Get all facts
-            facts_db = session.query(FactModel).filter(
-                FactModel.patient_id == patient_id
-            ).all()
+            # Stream only the fact columns the summary uses (server-side cursor).
+            # Rows come from our own table, so skip Pydantic re-validation;
+            # entity_type is coerced since summaries read entity_type.value
+            result = session.execute(
+                select(
+                    FactModel.entity_type,
+                    FactModel.entity_name,
+                    FactModel.extracted_text,
+                    FactModel.source_snippet,
+                    FactModel.confidence_score,
+                    FactModel.extraction_method,
+                    FactModel.anatomical_context,
+                    FactModel.medication_detail,
+                    FactModel.temporal_context,
+                    FactModel.is_negated,
+                    FactModel.is_historical
+                )
+                .where(FactModel.patient_id == patient_id)
+                .execution_options(stream_results=True, yield_per=1000)
+            )
+            facts = [
+                AtomicClinicalFact.model_construct(
+                    **{**row, "entity_type": EntityType(row["entity_type"])}
+                )
+                for partition in result.mappings().partitions()
+                for row in partition
+            ]
 
             # Get alerts
             alerts_db = session.query(AlertModel).filter(
@@ -57,19 +77,6 @@ def generate_summary_task(self, patient_id: int, summary_type: str = "discharge_
             ).all()
 
         # Convert to schema objects
-        from app.schemas import AtomicClinicalFact, ClinicalAlert, SummaryRequest
-        facts = [
-            AtomicClinicalFact(
-                entity_type=f.entity_type,
-                entity_name=f.entity_name,
-                extracted_text=f.extracted_text,
-                source_snippet=f.source_snippet,
-                confidence_score=f.confidence_score,
-                extraction_method=f.extraction_method
-            )
-            for f in facts_db
-        ]
-
         alerts = [
             ClinicalAlert(
                 alert_type=a.alert_type,
@@ -106,12 +113,8 @@ def generate_summary_task(self, patient_id: int, summary_type: str = "discharge_
         )
 
         logger.info(f"✓ Summary generated: {len(summary.sections)} sections")
-        return summary.dict()
+        return summary.model_dump(mode="json")
 
     except Exception as e:
         logger.error(f"Summary generation task failed: {e}", exc_info=True)
-        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
-
-    except Exception as e:
-        logger.error(f"Summary generation failed: {e}", exc_info=True)
-        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
+        raise self.retry(exc=e, countdown=retry_countdown(self.request.retries))
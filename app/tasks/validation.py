@@ -4,73 +4,126 @@ Celery tasks for asynchronous clinical data validation
 """
 
 import logging
-from app.celery_app import celery_app
+from typing import List, Optional, TYPE_CHECKING
+from app.celery_app import celery_app, retry_countdown
+
+if TYPE_CHECKING:
+    from app.schemas import ValidationReport
 
 logger = logging.getLogger(__name__)
 
 
 @celery_app.task(name="app.tasks.validation.validate_patient_data", bind=True, max_retries=3)
-def validate_patient_data_task(self, patient_id: int) -> dict:
+def validate_patient_data_task(self, patient_id: int, facts: Optional[List[dict]] = None) -> dict:
     """
     Validate patient clinical data asynchronously
 
     Args:
         patient_id: Patient ID
+        facts: Pre-fetched fact dictionaries; loaded from the database when omitted
 
     Returns:
         Validation report as dictionary
     """
     try:
-        logger.info(f"Starting async validation for patient {patient_id}")
-
-        # Get all facts for patient from database
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
-        from app.config import settings
-        from app.models import AtomicClinicalFact as FactModel, Document
-
-        engine = create_engine(settings.get_database_url(for_alembic=True))
-        Session = sessionmaker(bind=engine)
-
-        with Session() as session:
-            # Get all facts for patient
-            facts_db = session.query(FactModel).filter(
-                FactModel.patient_id == patient_id
-            ).all()
-
-            # Get all document text for source text validation
-            documents = session.query(Document).filter(
-                Document.patient_id == patient_id
-            ).all()
-
-            # Combine document texts
-            combined_text = "\n\n".join([doc.content or "" for doc in documents if doc.content])
-
-        # Convert to schema objects
-        from app.schemas import AtomicClinicalFact
-        facts = [
-            AtomicClinicalFact(
-                entity_type=f.entity_type,
-                entity_name=f.entity_name,
-                extracted_text=f.extracted_text,
-                source_snippet=f.source_snippet,
-                confidence_score=f.confidence_score,
-                extraction_method=f.extraction_method
-            )
-            for f in facts_db
-        ]
-
-        # Run validation
-        from app.modules.validation import validate_clinical_data
-        report = validate_clinical_data(facts, combined_text, patient_id)
-
-        logger.info(f"✓ Validation complete: Score {report.overall_quality_score}%")
-        return report.dict()
+        return _validate_patient_data(patient_id, facts).model_dump(mode="json")
 
     except Exception as e:
         logger.error(f"Validation task failed: {e}", exc_info=True)
-        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
+        raise self.retry(exc=e, countdown=retry_countdown(self.request.retries))
+
+
+@celery_app.task(name="app.tasks.validation.validate_extracted_facts", bind=True, max_retries=3)
+def validate_extracted_facts_task(self, facts: List[dict], patient_id: int) -> List[dict]:
+    """
+    Validate facts forwarded in memory by extract_facts in a chain
+
+    The chain passes the parent result as the first argument, so this entry
+    point takes facts first; validate_patient_data keeps patient_id first.
+    The report is cached for the patient and the facts are passed on to
+    the next step (persist_facts).
+
+    Args:
+        facts: Fact dictionaries returned by extract_facts
+        patient_id: Patient ID
+
+    Returns:
+        The same fact dictionaries
+    """
+    try:
+        report = _validate_patient_data(patient_id, facts)
+
+        from app.services.cache_service import cache_validation
+        cache_validation(patient_id, report)
+
+        return facts
 
     except Exception as e:
-        logger.error(f"Validation failed: {e}", exc_info=True)
-        raise self.retry(exc=e, countdown=60 * (2 ** self.request.retries))
+        logger.error(f"Validation task failed: {e}", exc_info=True)
+        raise self.retry(exc=e, countdown=retry_countdown(self.request.retries))
+
+
+def _validate_patient_data(patient_id: int, facts: Optional[List[dict]] = None) -> "ValidationReport":
+    """Load (or take forwarded) facts and source text, run validation, return the report"""
+    logger.info(f"Starting async validation for patient {patient_id}")
+
+    from sqlalchemy import select, func, literal
+    from sqlalchemy.dialects.postgresql import aggregate_order_by
+    from app.tasks._db import SessionLocal
+    from app.models import AtomicClinicalFact as FactModel, Document
+    from app.schemas import AtomicClinicalFact, EntityType
+
+    with SessionLocal() as session:
+        # Get all facts for patient unless forwarded in memory: only the
+        # columns the validators read
+        if facts is None:
+            result = session.execute(
+                select(
+                    FactModel.entity_type,
+                    FactModel.entity_name,
+                    FactModel.extracted_text,
+                    FactModel.source_snippet,
+                    FactModel.confidence_score,
+                    FactModel.extraction_method,
+                    FactModel.anatomical_context,
+                    FactModel.medication_detail,
+                    FactModel.temporal_context,
+                    FactModel.is_negated,
+                    FactModel.is_historical
+                )
+                .where(FactModel.patient_id == patient_id)
+                .execution_options(stream_results=True, yield_per=1000)
+            )
+            fact_rows = [
+                row
+                for partition in result.mappings().partitions()
+                for row in partition
+            ]
+        else:
+            fact_rows = facts
+
+        # Concatenate all document text server-side for source text validation
+        combined_text = session.execute(
+            select(
+                func.string_agg(
+                    Document.raw_text,
+                    aggregate_order_by(literal("\n\n"), Document.document_date)
+                )
+            ).where(Document.patient_id == patient_id)
+        ).scalar_one() or ""
+
+    # Database rows and forwarded dicts have the same shape (detail fields are
+    # plain dicts), so both are built without Pydantic re-validation
+    fact_models = [
+        AtomicClinicalFact.model_construct(
+            **{**row, "entity_type": EntityType(row["entity_type"])}
+        )
+        for row in fact_rows
+    ]
+
+    # Run validation
+    from app.modules.validation import validate_clinical_data
+    report = validate_clinical_data(fact_models, combined_text, patient_id)
+
+    logger.info(f"✓ Validation complete: Score {report.overall_quality_score}%")
+    return report
@@ -7,6 +7,9 @@ Downloads all required spaCy, scispaCy, and transformer models
 import sys
 import subprocess
 import logging
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 logging.basicConfig(
@@ -15,6 +18,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Downloads run concurrently; installs into site-packages are serialized
+MAX_PARALLEL_DOWNLOADS = 4
+_install_lock = threading.Lock()
+
 
 def run_command(cmd, description):
     """Run a shell command and handle errors"""
@@ -41,6 +48,32 @@ def run_command(cmd, description):
         return False
 
 
+def run_commands_parallel(commands):
+    """
+    Run commands concurrently
+
+    Args:
+        commands: Dict of name -> (cmd, description)
+
+    Returns:
+        List of names whose command succeeded
+    """
+    if not commands:
+        return []
+
+    succeeded = []
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_DOWNLOADS, len(commands))) as executor:
+        futures = {
+            executor.submit(run_command, cmd, description): name
+            for name, (cmd, description) in commands.items()
+        }
+        for future in as_completed(futures):
+            if future.result():
+                succeeded.append(futures[future])
+
+    return succeeded
+
+
 def download_spacy_models():
     """Download required spaCy models"""
     logger.info("\n" + "="*60)
@@ -54,10 +87,13 @@ def download_spacy_models():
     success = True
     for model_name, description in models:
         logger.info(f"\nDownloading {description}...")
-        if not run_command(
-            [sys.executable, "-m", "spacy", "download", model_name],
-            f"Download {model_name}"
-        ):
+        # spacy download installs via pip, so it shares the install lock
+        with _install_lock:
+            installed = run_command(
+                [sys.executable, "-m", "spacy", "download", model_name],
+                f"Download {model_name}"
+            )
+        if not installed:
             success = False
             logger.warning(f"Failed to download {model_name}, continuing...")
 
@@ -84,15 +120,31 @@ def download_scispacy_models():
         ),
     ]
 
-    success = True
-    for model_name, url, description in models:
-        logger.info(f"\nDownloading {description} ({model_name})...")
-        if not run_command(
-            [sys.executable, "-m", "pip", "install", url],
-            f"Install {model_name}"
-        ):
-            success = False
-            logger.warning(f"Failed to download {model_name}, continuing...")
+    with tempfile.TemporaryDirectory() as download_dir:
+        # Fetch all archives concurrently
+        downloads = {
+            model_name: (
+                [sys.executable, "-m", "pip", "download", "--no-deps", "-d", download_dir, url],
+                f"Download {model_name} ({description})"
+            )
+            for model_name, url, description in models
+        }
+        downloaded = run_commands_parallel(downloads)
+
+        success = len(downloaded) == len(models)
+        for model_name, _, _ in models:
+            if model_name not in downloaded:
+                logger.warning(f"Failed to download {model_name}, continuing...")
+
+        # Install the local archives in a single pip run
+        archives = sorted(str(path) for path in Path(download_dir).iterdir())
+        if archives:
+            with _install_lock:
+                if not run_command(
+                    [sys.executable, "-m", "pip", "install", *archives],
+                    f"Install {len(archives)} scispaCy models"
+                ):
+                    success = False
 
     return success
 
@@ -167,9 +219,12 @@ def main():
 
     logger.info(f"Python version: {sys.version}")
 
-    # Download models
-    spacy_success = download_spacy_models()
-    scispacy_success = download_scispacy_models()
+    # Download models (spaCy and scispaCy phases run concurrently)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        spacy_future = executor.submit(download_spacy_models)
+        scispacy_future = executor.submit(download_scispacy_models)
+        spacy_success = spacy_future.result()
+        scispacy_success = scispacy_future.result()
 
     # Verify installations
     if spacy_success and scispacy_success:
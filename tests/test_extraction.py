@@ -8,11 +8,40 @@ from app.modules.extraction import (
     DiagnosisExtractor,
     ProcedureExtractor,
     MedicationExtractor,
-    NeuroExamExtractor
+    NeuroExamExtractor,
+    ExtractionResultCache,
+    extraction_result_cache
 )
 from app.schemas import EntityType
 
 
+@pytest.fixture(scope="session")
+def engine():
+    """Extraction engine shared across tests (models load once per session)"""
+    return HybridExtractionEngine()
+
+
+@pytest.fixture(scope="module")
+def sample_text():
+    """Sample clinical text"""
+    return """
+    Patient is a 45-year-old male who underwent left frontal craniotomy
+    on POD 3. Currently on dexamethasone 4mg BID and levetiracetam 500mg BID.
+    Neurological examination shows GCS 15, motor strength 5/5 throughout.
+    Sodium 138 mmol/L. Follow-up MRI shows expected post-operative changes.
+    """
+
+
+@pytest.fixture(scope="module")
+def facts(engine, sample_text):
+    """Facts extracted from the sample text (extracted once for the module)"""
+    return engine.extract_all_facts(
+        text=sample_text,
+        patient_id=1,
+        document_id=1
+    )
+
+
 class TestMedicationExtractor:
     """Test medication extraction"""
 
@@ -25,7 +54,7 @@ class TestMedicationExtractor:
         assert len(facts) > 0
         med_fact = facts[0]
         assert med_fact.entity_type == EntityType.MEDICATION
-        assert "levetiracetam" in med_fact.entity_name.lower()
+        assert med_fact.entity_name == "levetiracetam"
         assert med_fact.medication_detail is not None
         assert med_fact.medication_detail.get("dose_value") == 500
         assert med_fact.medication_detail.get("dose_unit") == "mg"
@@ -37,9 +66,17 @@ class TestMedicationExtractor:
         facts = MedicationExtractor.extract(text)
 
         assert len(facts) >= 2
-        med_names = [f.entity_name.lower() for f in facts]
-        assert any("dexamethasone" in name for name in med_names)
-        assert any("levetiracetam" in name for name in med_names)
+        med_names = {f.entity_name for f in facts}
+        assert {"dexamethasone", "levetiracetam"} <= med_names
+
+
+    @pytest.mark.parametrize("unit", ["\u03bcg", "\u00b5g"])
+    def test_microgram_units(self, unit):
+        """Test both micro characters (Greek mu, micro sign) normalize to mcg"""
+        facts = MedicationExtractor.extract(f"Fentanyl 50 {unit} IV")
+
+        assert facts[0].medication_detail.get("dose_value") == 50
+        assert facts[0].medication_detail.get("dose_unit") == "mcg"
 
 
 class TestProcedureExtractor:
@@ -54,7 +91,7 @@ class TestProcedureExtractor:
         assert len(facts) > 0
         proc_fact = facts[0]
         assert proc_fact.entity_type == EntityType.PROCEDURE
-        assert "craniotomy" in proc_fact.entity_name.lower()
+        assert proc_fact.entity_name == "craniotomy"
         assert proc_fact.anatomical_context is not None
 
     def test_extract_procedure_with_laterality(self):
@@ -98,26 +135,8 @@ class TestNeuroExamExtractor:
 class TestHybridExtractionEngine:
     """Test complete extraction engine"""
 
-    @pytest.fixture
-    def sample_text(self):
-        """Sample clinical text"""
-        return """
-        Patient is a 45-year-old male who underwent left frontal craniotomy
-        on POD 3. Currently on dexamethasone 4mg BID and levetiracetam 500mg BID.
-        Neurological examination shows GCS 15, motor strength 5/5 throughout.
-        Sodium 138 mmol/L. Follow-up MRI shows expected post-operative changes.
-        """
-
-    def test_extract_all_facts(self, sample_text):
+    def test_extract_all_facts(self, engine, sample_text, facts):
         """Test extracting all facts from clinical text"""
-        engine = HybridExtractionEngine()
-
-        facts = engine.extract_all_facts(
-            text=sample_text,
-            patient_id=1,
-            document_id=1
-        )
-
         assert len(facts) > 0
 
         # Check for different entity types
@@ -125,11 +144,44 @@ class TestHybridExtractionEngine:
         assert EntityType.PROCEDURE in entity_types
         assert EntityType.MEDICATION in entity_types
 
-    def test_deduplication(self):
+        # Batched extraction (nlp.pipe) should agree with the single-document path;
+        # clear the result cache so the batch run extracts instead of hitting it
+        extraction_result_cache.clear()
+        batch_facts = engine.extract_all_facts_batch([
+            {"text": sample_text, "patient_id": 1, "document_id": 1},
+            {"text": "Patient on dexamethasone 4mg BID", "patient_id": 1, "document_id": 2},
+        ])
+
+        assert len(batch_facts) == 2
+        assert [f.entity_name for f in batch_facts[0]] == [f.entity_name for f in facts]
+        assert any(f.entity_type == EntityType.MEDICATION for f in batch_facts[1])
+
+    def test_batch_extracts_only_uncached(self, engine, sample_text, monkeypatch):
+        """Test batched extraction parses and extracts only cache misses"""
+        engine.extract_all_facts(sample_text, 1, 1)
+
+        extracted = []
+        extract_all_facts = engine.extract_all_facts
+
+        def record(text, patient_id, document_id, doc=None):
+            extracted.append(text)
+            return extract_all_facts(text, patient_id, document_id, doc=doc)
+
+        monkeypatch.setattr(engine, "extract_all_facts", record)
+        uncached_text = "Started levetiracetam 750mg BID"
+
+        batch_facts = engine.extract_all_facts_batch([
+            {"text": sample_text, "patient_id": 1, "document_id": 1},
+            {"text": uncached_text, "patient_id": 1, "document_id": 3},
+        ])
+
+        assert extracted == [uncached_text]
+        assert len(batch_facts) == 2 and batch_facts[0]
+
+    def test_deduplication(self, engine):
         """Test fact deduplication"""
         text = "Patient on levetiracetam. Started levetiracetam 500mg BID."
 
-        engine = HybridExtractionEngine()
         facts = engine.extract_all_facts(text, 1, 1)
 
         # Should deduplicate duplicate medication mentions
@@ -137,29 +189,35 @@ class TestHybridExtractionEngine:
         # Even with two mentions, should have reasonable deduplication
         assert len(med_facts) >= 1
 
-    def test_confidence_filtering(self):
+    def test_confidence_filtering(self, facts):
         """Test confidence threshold filtering"""
-        text = "Patient on dexamethasone 4mg BID"
-
-        engine = HybridExtractionEngine()
-        facts = engine.extract_all_facts(text, 1, 1)
-
         # All returned facts should meet confidence threshold
         for fact in facts:
             assert fact.confidence_score >= 0.7  # Default threshold
 
 
+class TestExtractionResultCache:
+    """Test the extraction result cache"""
+
+    def test_key_includes_context(self):
+        """Test results from a different extraction setup are not shared"""
+        key = ExtractionResultCache.key
+
+        assert key("GCS 15", (True, "openai")) == key("GCS 15", (True, "openai"))
+        assert key("GCS 15", (True, "openai")) != key("GCS 15", (False, "openai"))
+        assert key("GCS 15", (True, "openai")) != key("GCS 14", (True, "openai"))
+
+
 class TestTemporalExtraction:
     """Test temporal information extraction"""
 
-    def test_extract_pod(self):
+    def test_extract_pod(self, engine):
         """Test POD extraction"""
         text = "Patient is POD 5 from craniotomy"
 
         from app.modules.extraction import TemporalExtractor
 
         # This is tested through the complete extraction
-        engine = HybridExtractionEngine()
         facts = engine.extract_all_facts(text, 1, 1)
 
         # Check if any facts have POD context
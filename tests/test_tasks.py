@@ -0,0 +1,161 @@
+"""
+Unit tests for Celery tasks and their database helpers
+"""
+
+import json
+import re
+
+import pytest
+
+# Task modules need the worker stack (Celery broker client, SQLAlchemy engine)
+pytest.importorskip("celery")
+pytest.importorskip("sqlalchemy")
+
+from app.tasks import _db, validation  # noqa: E402
+from app.tasks.extraction import persist_facts_task  # noqa: E402
+from app.tasks.pipelines import build_document_ingest_pipeline  # noqa: E402
+from app.tasks.validation import validate_extracted_facts_task  # noqa: E402
+from app.schemas import AtomicClinicalFact, EntityType  # noqa: E402
+
+# One COPY CSV field: a quoted value (quotes doubled) or the bare NULL marker
+COPY_FIELD = re.compile(r'"((?:[^"]|"")*)"|(\\N)')
+
+
+def parse_copy_csv(text: str) -> list:
+    """Read COPY ... (FORMAT csv, NULL '\\N') text back into rows, as PostgreSQL would"""
+    rows, row, pos = [], [], 0
+    while pos < len(text):
+        match = COPY_FIELD.match(text, pos)
+        assert match, f"unparseable COPY CSV at {pos}: {text[pos:pos + 20]!r}"
+        row.append(None if match.group(2) else match.group(1).replace('""', '"'))
+        pos = match.end()
+        separator = text[pos]
+        pos += 1
+        if separator == "\n":
+            rows.append(row)
+            row = []
+        else:
+            assert separator == ","
+    return rows
+
+
+@pytest.fixture
+def facts():
+    """Fact dictionaries as returned by extract_facts"""
+    return [
+        {
+            "entity_type": EntityType.MEDICATION.value,
+            "entity_name": "levetiracetam",
+            "extracted_text": "levetiracetam 500mg",
+            "source_snippet": "Patient on levetiracetam 500mg BID",
+            "confidence_score": 0.9,
+            "extraction_method": "rule",
+            "medication_detail": {"generic_name": "levetiracetam", "dose_value": 500.0, "dose_unit": "mg"},
+            "anatomical_context": None,
+            "is_negated": False,
+            "is_historical": False
+        }
+    ]
+
+
+class TestDocumentIngestPipeline:
+    """Test the extract -> validate -> persist -> graph sync chain"""
+
+    def test_chain_signatures(self):
+        """Test each step's task, arguments and immutability"""
+        pipeline = build_document_ingest_pipeline("Patient on levetiracetam 500mg", 7, 42)
+
+        extract, validate, persist, sync = pipeline.tasks
+
+        assert extract.task == "app.tasks.extraction.extract_facts"
+        assert tuple(extract.args) == ("Patient on levetiracetam 500mg", 7, 42)
+
+        # Mutable steps receive the previous result as their first argument
+        assert validate.task == "app.tasks.validation.validate_extracted_facts"
+        assert tuple(validate.args) == ()
+        assert validate.kwargs == {"patient_id": 7}
+        assert not validate.immutable
+
+        assert persist.task == "app.tasks.extraction.persist_facts"
+        assert tuple(persist.args) == ()
+        assert persist.kwargs == {"patient_id": 7, "document_id": 42}
+        assert not persist.immutable
+
+        # Graph sync reads persisted facts, not the previous result
+        assert sync.task == "app.tasks.graph_sync.sync_patient_to_graph"
+        assert tuple(sync.args) == (7,)
+        assert sync.immutable
+
+    def test_validation_forwards_facts(self, monkeypatch, facts):
+        """Test validation passes the extracted facts on to persist_facts"""
+        validated = []
+        monkeypatch.setattr(
+            validation, "_validate_patient_data",
+            lambda patient_id, facts: validated.append((patient_id, facts)) or object()
+        )
+        monkeypatch.setattr(
+            "app.services.cache_service.cache_validation", lambda patient_id, report: True
+        )
+
+        result = validate_extracted_facts_task(facts, patient_id=7)
+
+        assert validated == [(7, facts)]
+        assert result == facts
+
+    def test_persist_stamps_ids(self, monkeypatch, facts):
+        """Test persisted rows carry the chain's patient and document ids"""
+        inserted = []
+        monkeypatch.setattr(_db, "bulk_insert_facts", lambda rows: inserted.extend(rows) or len(rows))
+
+        result = persist_facts_task(facts, patient_id=7, document_id=42)
+
+        assert result == {"document_id": 42, "facts_inserted": 1}
+        assert inserted[0]["patient_id"] == 7
+        assert inserted[0]["document_id"] == 42
+        assert inserted[0]["medication_detail"] == facts[0]["medication_detail"]
+
+
+class TestBulkInsertFacts:
+    """Test the COPY CSV written by bulk_insert_facts"""
+
+    def test_round_trip(self):
+        """Test model_dump rows survive COPY CSV encoding"""
+        fact = AtomicClinicalFact(
+            entity_type=EntityType.MEDICATION,
+            entity_name="dexamethasone",
+            extracted_text='dexamethasone 4mg "taper"',
+            source_snippet='Plan:\n- continue "dex", 4mg BID\r\n- follow up',
+            medication_detail={"generic_name": "dexamethasone", "dose_value": 4.0, "dose_unit": "mg"},
+            is_negated=True
+        )
+        row = {**fact.model_dump(mode="json"), "patient_id": 7, "document_id": 42}
+
+        (parsed,) = parse_copy_csv(_db.build_fact_copy_csv([row]))
+        values = dict(zip(_db.FACT_COPY_COLUMNS, parsed))
+
+        assert values["patient_id"] == "7"
+        assert values["document_id"] == "42"
+        assert values["entity_type"] == EntityType.MEDICATION.value
+        assert values["extracted_text"] == row["extracted_text"]
+        assert values["source_snippet"] == row["source_snippet"]
+
+        # JSON detail columns carry the dumped dict; unset ones are NULL
+        assert json.loads(values["medication_detail"]) == row["medication_detail"]
+        assert values["anatomical_context"] is None
+        assert values["temporal_context"] is None
+        assert values["timestamp"] is None
+
+        # NOT NULL flags: given values are kept, missing ones default to false
+        assert values["is_negated"] == "True"
+        assert values["is_hypothetical"] == "False"
+        assert values["synced_to_neo4j"] == "False"
+
+    def test_null_marker_text_is_not_null(self):
+        """Test text equal to the NULL marker is quoted, not read back as NULL"""
+        row = {"patient_id": 1, "document_id": 1, "entity_type": "diagnosis", "entity_name": "\\N"}
+
+        (parsed,) = parse_copy_csv(_db.build_fact_copy_csv([row]))
+        values = dict(zip(_db.FACT_COPY_COLUMNS, parsed))
+
+        assert values["entity_name"] == "\\N"
+        assert values["extracted_text"] is None